@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 import hashlib
 import hmac
 from datetime import datetime, timedelta
@@ -8,11 +8,18 @@ from bitcoinrpc.authproxy import AuthServiceProxy, JSONRPCException
 import logging
 import time
 import socket
-from threading import Thread, Lock, Event
-from queue import Queue
+import http.client
+from threading import Lock, RLock, BoundedSemaphore
 from datetime import datetime
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# getLevelName maps a known name to its number and anything else to a string
+_log_level_name = (os.environ.get('LOG_LEVEL') or 'INFO').upper()
+LOG_LEVEL = logging.getLevelName(_log_level_name)
+if not isinstance(LOG_LEVEL, int):
+    LOG_LEVEL = logging.INFO
+logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s - %(levelname)s - %(message)s')
+if LOG_LEVEL == logging.INFO and _log_level_name != 'INFO':
+    logging.warning(f"Unknown LOG_LEVEL {_log_level_name!r}, using INFO")
 
 class BitcoinUtils:
     # Config file location - handle both Windows and Unix paths
@@ -23,15 +30,19 @@ class BitcoinUtils:
     NODE_PORT = os.environ.get('BITCOIN_NODE_PORT', '8332')
     RPC_USER = os.environ.get('BITCOIN_RPC_USER')
     RPC_PASS = os.environ.get('BITCOIN_RPC_PASS')
-    _rpc_connection = None
+    # Keep-alive connections shared by scanner tabs and pollers
+    RPC_POOL_SIZE = int(os.environ.get('BITCOIN_RPC_POOL_SIZE', '4'))
+    _idle_connections = []  # Connections not in use; each one serves a single caller at a time
+    _pool_slots = BoundedSemaphore(RPC_POOL_SIZE)
+    _pool_generation = 0  # Bumped by configure_node so connections to old settings are dropped
+    # Seconds a get_node_info result is shared before the node is asked again
+    NODE_INFO_TTL = 1.0
+    _node_info_cache = (0.0, None)  # (monotonic time fetched, node info)
+    _cache_lock = Lock()
     _config_loaded = False
-    _connection_queue = Queue()
-    _async_result = None
-    _instance_lock = Lock()
+    _instance_lock = RLock()
     _connection_timeout = 5
     _rpc_timeout = 30
-    _connection_threads = []
-    _shutdown_event = Event()
 
     @classmethod
     def generate_checksum(cls, payload: bytes) -> bytes:
@@ -122,6 +133,13 @@ class BitcoinUtils:
                     cls.NODE_PORT = settings.get('port', cls.NODE_PORT)
                     cls.RPC_USER = settings.get('username')
                     cls.RPC_PASS = settings.get('password')
+                    if settings.get('pool_size'):
+                        # A bad pool size keeps the default rather than
+                        # discarding the node address and credentials with it
+                        try:
+                            cls._resize_pool(int(settings['pool_size']))
+                        except ValueError as e:
+                            logging.warning(f"Ignoring invalid pool_size {settings['pool_size']!r}: {str(e)}")
 
                     if not all([cls.NODE_URL, cls.NODE_PORT, cls.RPC_USER, cls.RPC_PASS]):
                         logging.error("Missing required node settings")
@@ -138,13 +156,15 @@ class BitcoinUtils:
             return False
 
     @classmethod
-    def save_config(cls, url: str, port: str, username: str, password: str, wallet_dir: str):
+    def save_config(cls, url: str, port: str, username: str, password: str, wallet_dir: str,
+                    pool_size: Optional[int] = None):
         """Save configuration to file."""
         try:
             config_content = f"""url={url}
 port={port}
 username={username}
 password={password}
+pool_size={pool_size or cls.RPC_POOL_SIZE}
 last_updated={datetime.now().strftime('%Y-%m-%d')}
 """
             os.makedirs(os.path.dirname(cls.CONFIG_FILE), exist_ok=True)
@@ -164,67 +184,147 @@ last_updated={datetime.now().strftime('%Y-%m-%d')}
             return False
 
     @classmethod
-    def configure_node(cls, node_url: str, port: str, rpc_user: str, rpc_pass: str):
+    def configure_node(cls, node_url: str, port: str, rpc_user: str, rpc_pass: str,
+                       pool_size: Optional[int] = None):
         """Configure Bitcoin node connection settings."""
-        cls.NODE_URL = node_url
-        cls.NODE_PORT = port
-        cls.RPC_USER = rpc_user
-        cls.RPC_PASS = rpc_pass
-        cls._rpc_connection = None  # Reset connection to use new settings
+        # Everything is checked before anything changes, so a bad value
+        # can't leave the settings half applied
+        if not node_url:
+            raise ValueError("Node URL must not be empty")
+        if not str(port).isdigit() or not 0 < int(port) < 65536:
+            raise ValueError(f"Invalid node port: {port}")
+        if pool_size is not None:
+            cls._check_pool_size(pool_size)
+
+        with cls._instance_lock:
+            cls.NODE_URL = node_url
+            cls.NODE_PORT = port
+            cls.RPC_USER = rpc_user
+            cls.RPC_PASS = rpc_pass
+            if pool_size is not None:
+                cls._resize_pool(pool_size)
+            # Reset connections to use new settings
+            cls._idle_connections.clear()
+            cls._pool_generation += 1
+            cls._node_info_cache = (0.0, None)
+
+    @classmethod
+    def _resize_pool(cls, pool_size: int):
+        """Bound the number of RPC calls that may run at once."""
+        cls._check_pool_size(pool_size)
+        with cls._instance_lock:
+            if pool_size != cls.RPC_POOL_SIZE:
+                # Calls in flight release the semaphore they acquired
+                cls.RPC_POOL_SIZE = pool_size
+                cls._pool_slots = BoundedSemaphore(pool_size)
+                del cls._idle_connections[pool_size:]
+
+    @staticmethod
+    def _check_pool_size(pool_size: int):
+        if pool_size < 1:
+            raise ValueError("RPC pool size must be at least 1")
 
     @classmethod
     def get_rpc_connection(cls) -> AuthServiceProxy:
-        """Get or create RPC connection to Bitcoin node with improved handling."""
+        """Create a verified RPC connection to the Bitcoin node."""
         with cls._instance_lock:
             cls._ensure_config_loaded()
 
-            if cls._rpc_connection is None:
-                if not all([cls.RPC_USER, cls.RPC_PASS]):
-                    logging.error("Bitcoin node credentials not configured")
-                    raise ValueError("Bitcoin node credentials not configured")
+            if not all([cls.RPC_USER, cls.RPC_PASS]):
+                logging.error("Bitcoin node credentials not configured")
+                raise ValueError("Bitcoin node credentials not configured")
+
+            node_url, node_port = cls.NODE_URL, cls.NODE_PORT
+            rpc_url = f"http://{cls.RPC_USER}:{cls.RPC_PASS}@{node_url}:{node_port}"
+
+        try:
+            logging.debug(f"Attempting RPC connection to {node_url}:{node_port}")
+
+            # Test socket connection first with shorter timeout
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(cls._connection_timeout)
+            try:
+                sock.connect((node_url, int(node_port)))
+                logging.debug("Socket connection successful")
+            except Exception as e:
+                logging.error(f"Socket connection failed: {str(e)}")
+                raise ConnectionError(f"Cannot connect to Bitcoin node: {str(e)}")
+            finally:
+                sock.close()
+
+            # Create RPC connection with timeout
+            rpc = AuthServiceProxy(rpc_url, timeout=cls._rpc_timeout)
+
+            # Test connection with simple command
+            rpc.getblockcount()
+            logging.debug("RPC connection established and verified")
+            return rpc
+
+        except Exception as e:
+            logging.error(f"Failed to establish RPC connection: {str(e)}", exc_info=True)
+            raise
+
+    @classmethod
+    def _rpc_call(cls, method: str, *params):
+        """Run an RPC call on a pooled keep-alive connection."""
+        return cls._run_pooled(method, lambda rpc: getattr(rpc, method)(*params))
+
+    @classmethod
+    def rpc_batch(cls, calls: List[Tuple[str, list]]) -> list:
+        """Run several RPC calls in one JSON-RPC batch request, returning results in call order."""
+        # Bitcoin Core answers a batch in request order, which batch_ relies on
+        return cls._run_pooled("batch", lambda rpc: rpc.batch_([[method, *params] for method, params in calls]))
+
+    @classmethod
+    def _run_pooled(cls, label: str, call):
+        """Run call(rpc) on a pooled connection, reconnecting once if it went stale."""
+        with cls._pool_slots:
+            for attempt in range(2):
+                with cls._instance_lock:
+                    generation = cls._pool_generation
+                    # A retry always reconnects; other idle connections may be just as stale
+                    rpc = cls._idle_connections.pop() if cls._idle_connections and not attempt else None
+                if rpc is None:
+                    rpc = cls.get_rpc_connection()
 
                 try:
-                    rpc_url = f"http://{cls.RPC_USER}:{cls.RPC_PASS}@{cls.NODE_URL}:{cls.NODE_PORT}"
-                    logging.debug(f"Attempting RPC connection to {cls.NODE_URL}:{cls.NODE_PORT}")
-
-                    # Test socket connection first with shorter timeout
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(cls._connection_timeout)
-                    try:
-                        sock.connect((cls.NODE_URL, int(cls.NODE_PORT)))
-                        logging.debug("Socket connection successful")
-                    except Exception as e:
-                        logging.error(f"Socket connection failed: {str(e)}")
-                        raise ConnectionError(f"Cannot connect to Bitcoin node: {str(e)}")
-                    finally:
-                        sock.close()
-
-                    # Create RPC connection with timeout
-                    cls._rpc_connection = AuthServiceProxy(rpc_url, timeout=cls._rpc_timeout)
-
-                    # Test connection with simple command
-                    cls._rpc_connection.getblockcount()
-                    logging.debug("RPC connection established and verified")
-
-                except Exception as e:
-                    cls._rpc_connection = None
-                    logging.error(f"Failed to establish RPC connection: {str(e)}", exc_info=True)
+                    result = call(rpc)
+                except (http.client.HTTPException, ConnectionError) as e:
+                    # The node drops idle keep-alive connections; start a fresh one
+                    if attempt:
+                        raise
+                    logging.debug(f"RPC connection lost during {label}, reconnecting: {str(e)}")
+                    continue
+                except OSError:
+                    # Timeouts aren't retried, which would double the wait
+                    # before the error is reported; the connection is dropped
                     raise
+                except Exception:
+                    # An RPC error reply leaves the connection usable
+                    cls._release_connection(rpc, generation)
+                    raise
+
+                cls._release_connection(rpc, generation)
+                return result
 
-            return cls._rpc_connection
+    @classmethod
+    def _release_connection(cls, rpc: AuthServiceProxy, generation: int):
+        """Return a connection to the idle pool unless the settings changed while it was out."""
+        with cls._instance_lock:
+            if generation == cls._pool_generation and len(cls._idle_connections) < cls.RPC_POOL_SIZE:
+                cls._idle_connections.append(rpc)
 
     @classmethod
     def test_node_connection(cls) -> Tuple[bool, str]:
         """Test connection to Bitcoin node."""
         try:
             logging.debug("Starting node connection test")
-            rpc = cls.get_rpc_connection()
-            blockchain_info = rpc.getblockchaininfo()
+            blockchain_info = cls._rpc_call('getblockchaininfo')
             logging.debug("Got blockchain info")
 
             network = blockchain_info.get('chain', 'unknown')
             blocks = blockchain_info.get('blocks', 0)
-            peers = rpc.getconnectioncount()
+            peers = cls._rpc_call('getconnectioncount')
             logging.debug(f"Got connection count: {peers}")
 
             # Add end marker
@@ -254,12 +354,10 @@ last_updated={datetime.now().strftime('%Y-%m-%d')}
         retry_count = 3
         for attempt in range(retry_count):
             try:
-                rpc = cls.get_rpc_connection()
-                balance = rpc.getreceivedbyaddress(address)
+                balance = cls._rpc_call('getreceivedbyaddress', address)
                 return float(balance)
             except Exception as e:
                 logging.warning(f"Balance check attempt {attempt + 1} failed: {str(e)}")
-                cls._rpc_connection = None
                 if attempt < retry_count - 1:
                     time.sleep(1)
                     continue
@@ -268,8 +366,7 @@ last_updated={datetime.now().strftime('%Y-%m-%d')}
     @classmethod
     def validate_address(cls, address: str) -> bool:
         """Validate Bitcoin address format using the node."""
-        rpc = cls.get_rpc_connection()
-        result = rpc.validateaddress(address)
+        result = cls._rpc_call('validateaddress', address)
         return result.get('isvalid', False)
 
     @classmethod
@@ -282,36 +379,30 @@ last_updated={datetime.now().strftime('%Y-%m-%d')}
         for attempt in range(retry_count):
             try:
                 logging.debug(f"Verification attempt {attempt + 1}/{retry_count}")
-                rpc = cls.get_rpc_connection()
-
                 # Try basic command first
                 logging.debug("Testing basic RPC command")
-                network_info = rpc.getnetworkinfo()
+                network_info = cls._rpc_call('getnetworkinfo')
                 logging.debug(f"Network info received: version {network_info.get('version', 'unknown')}")
 
                 # Then get blockchain info
-                blockchain_info = rpc.getblockchaininfo()
+                blockchain_info = cls._rpc_call('getblockchaininfo')
                 logging.debug(f"Blockchain info received: chain {blockchain_info.get('chain', 'unknown')}")
 
                 if not blockchain_info:
                     raise ConnectionError("Could not fetch blockchain info from node")
 
-                # Reset connection on success to prevent stale connections
-                cls._rpc_connection = None
                 logging.info("Live node verification successful")
                 return
 
             except JSONRPCException as e:
                 last_error = f"RPC Error: {str(e)}"
                 logging.warning(f"Node verification attempt {attempt + 1} failed: {str(e)}")
-                cls._rpc_connection = None
                 if attempt < retry_count - 1:
                     logging.debug(f"Waiting 2 seconds before retry {attempt + 2}")
                     time.sleep(2)
             except Exception as e:
                 last_error = str(e)
                 logging.warning(f"Node verification attempt {attempt + 1} failed: {str(e)}", exc_info=True)
-                cls._rpc_connection = None
                 if attempt < retry_count - 1:
                     logging.debug(f"Waiting 2 seconds before retry {attempt + 2}")
                     time.sleep(2)
@@ -335,36 +426,40 @@ last_updated={datetime.now().strftime('%Y-%m-%d')}
 
     @classmethod
     def get_node_info(cls) -> Dict:
-        """Get current node information with improved error handling and timeouts."""
-        logging.debug("Starting get_node_info")
-        try:
-            start_time = time.time()
-            timeout = 5  # 5 second timeout
-
-            # Will raise error if node isn't accessible
-            cls.verify_live_node()
-            logging.debug("Live node verified")
-
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Node info collection timed out during verification")
-
-            rpc = cls.get_rpc_connection()
-            logging.debug("Got RPC connection")
-
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Node info collection timed out getting RPC connection")
-
-            blockchain_info = rpc.getblockchaininfo()
-            logging.debug(f"Got blockchain info: {blockchain_info.get('chain', 'unknown')}")
-
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Node info collection timed out getting blockchain info")
+        """Get current node information, reusing a result fetched within NODE_INFO_TTL."""
+        # Pollers that arrive while a fetch is running wait for it and share its result
+        with cls._cache_lock:
+            fetched_at, node_info = cls._node_info_cache
+            if node_info is None or time.monotonic() - fetched_at >= cls.NODE_INFO_TTL:
+                try:
+                    node_info = cls._fetch_node_info()
+                except Exception:
+                    # Don't let latest_node_info keep reporting a node that stopped answering
+                    cls._node_info_cache = (0.0, None)
+                    raise
+                cls._node_info_cache = (time.monotonic(), node_info)
+            return dict(node_info)
 
-            peers = rpc.getconnectioncount()
-            logging.debug(f"Got connection count: {peers}")
+    @classmethod
+    def latest_node_info(cls) -> Optional[Dict]:
+        """Get the node information from the last successful poll without contacting the node."""
+        node_info = cls._node_info_cache[1]
+        return dict(node_info) if node_info is not None else None
 
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Node info collection timed out getting peer count")
+    @classmethod
+    def _fetch_node_info(cls) -> Dict:
+        """Get current node information in a single batched round-trip."""
+        logging.debug("Starting get_node_info")
+        try:
+            # A successful reply is itself the live node check
+            blockchain_info, peers = cls.rpc_batch([
+                ('getblockchaininfo', []),
+                ('getconnectioncount', []),
+            ])
+            if not blockchain_info:
+                raise ConnectionError("Could not fetch blockchain info from node")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):  # Runs every poll; skip the formatting
+                logging.debug(f"Got blockchain info: {blockchain_info.get('chain', 'unknown')}, {peers} peers")
 
             # Prepare return value before logging
             result = {
@@ -385,93 +480,15 @@ last_updated={datetime.now().strftime('%Y-%m-%d')}
             raise
 
     @classmethod
-    def cleanup_threads(cls):
-        """Clean up any zombie connection test threads."""
-        current_time = time.time()
-        active_threads = []
-
-        for thread, start_time in cls._connection_threads:
-            if thread.is_alive():
-                if current_time - start_time > cls._connection_timeout:
-                    logging.warning(f"Force stopping thread {thread.name} - exceeded timeout")
-                    cls._shutdown_event.set()  # Signal thread to stop
-                else:
-                    active_threads.append((thread, start_time))
-            else:
-                thread.join(0)  # Clean up completed thread immediately
-
-        cls._connection_threads = active_threads
-
-    @classmethod
-    def test_connection_async(cls):
-        """Asynchronously test connection to Bitcoin node with proper cleanup."""
-        try:
-            # Clean up old threads first
-            cls.cleanup_threads()
-
-            # Clear previous results
-            while not cls._connection_queue.empty():
-                cls._connection_queue.get_nowait()
-
-            # Reset shutdown event
-            cls._shutdown_event.clear()
-
-            def _test_connection():
-                if cls._shutdown_event.is_set():
-                    return
-
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(2)  # Shorter timeout for initial test
-
-                    try:
-                        logging.debug(f"Testing socket connection to {cls.NODE_URL}:{cls.NODE_PORT}")
-                        sock.connect((cls.NODE_URL, int(cls.NODE_PORT)))
-
-                        if cls._shutdown_event.is_set():
-                            return
-
-                        # Only try RPC if socket connection succeeded
-                        try:
-                            rpc_url = f"http://{cls.RPC_USER}:{cls.RPC_PASS}@{cls.NODE_URL}:{cls.NODE_PORT}"
-                            rpc = AuthServiceProxy(rpc_url, timeout=5)
-                            rpc.getblockcount()  # Simple test command
-                            if not cls._shutdown_event.is_set():
-                                cls._connection_queue.put((True, None))
-                        except Exception as e:
-                            if not cls._shutdown_event.is_set():
-                                cls._connection_queue.put((False, f"RPC Error: {str(e)}"))
-                    except Exception as e:
-                        if not cls._shutdown_event.is_set():
-                            cls._connection_queue.put((False, f"Socket Error: {str(e)}"))
-                    finally:
-                        sock.close()
-                except Exception as e:
-                    if not cls._shutdown_event.is_set():
-                        cls._connection_queue.put((False, str(e)))
-
-            thread = Thread(target=_test_connection, name=f"NodeConnectionTest-{time.time()}", daemon=True)
-            thread.start()
-
-            # Store thread with its start time for cleanup
-            cls._connection_threads.append((thread, time.time()))
-            return True
-
-        except Exception as e:
-            logging.error(f"Error starting connection test: {str(e)}")
-            return False
-
-    @classmethod
-    def get_connection_status(cls):
-        """Get the result of the last async connection test with timeout handling."""
+    def test_connection(cls) -> Tuple[bool, Optional[str]]:
+        """Check that the node answers a simple RPC; returns (success, error message)."""
+        # Goes through the shared connections, so a healthy node is
+        # checked without a fresh TCP connect and HTTP handshake
         try:
-            if not cls._connection_queue.empty():
-                success, error = cls._connection_queue.get_nowait()
-                if success:
-                    return True, "Connected"
-                return False, error
-            return None, "Test pending"
+            logging.debug(f"Testing RPC connection to {cls.NODE_URL}:{cls.NODE_PORT}")
+            cls._rpc_call('getblockcount')  # Simple test command
+            return True, None
+        except ConnectionError as e:
+            return False, f"Socket Error: {str(e)}"
         except Exception as e:
-            return False, str(e)
-        finally:
-            cls.cleanup_threads()  # Clean up any completed or timed out threads
\ No newline at end of file
+            return False, f"RPC Error: {str(e)}"
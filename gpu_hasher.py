@@ -1,91 +1,280 @@
 import pyopencl as cl
 import numpy as np
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+import hashlib
 import logging
 import os
+import threading
+
+# SHA256 round constants and initial hash values
+SHA256_K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+], dtype=np.uint32)
+
+SHA256_H0 = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+], dtype=np.uint32)
+
+
+def _rotr(x: int, n: int) -> int:
+    return ((x >> n) | (x << (32 - n))) & 0xFFFFFFFF
+
+
+def _sha256_schedule(words) -> List[int]:
+    """Expand 16 big-endian message words into the 64-word SHA256 schedule."""
+    w = [int(x) for x in words]
+    for i in range(16, 64):
+        s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+        s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+        w.append((w[i - 16] + s0 + w[i - 7] + s1) & 0xFFFFFFFF)
+    return w
+
+
+def _shared_schedule(input_words: np.ndarray):
+    """Precompute the leading schedule words that are identical across a batch.
+
+    Returns the schedule of the first message and the index of the first
+    word that depends on a message word varying across the batch; every
+    schedule word before that index is the same for all messages.
+    """
+    invariant = list((input_words == input_words[0]).all(axis=0))
+    first_dirty = 16
+    while first_dirty < 64 and all(invariant[first_dirty - k] for k in (2, 7, 15, 16)):
+        invariant.append(True)
+        first_dirty += 1
+    return np.array(_sha256_schedule(input_words[0]), dtype=np.uint32), first_dirty
+
+
+def _sha256_compress(state, block: bytes):
+    """Run one SHA256 compression of a 64-byte block over an 8-word state."""
+    w = _sha256_schedule(np.frombuffer(block, dtype='>u4'))
+
+    a, b, c, d, e, f, g, h = (int(x) for x in state)
+    for i in range(64):
+        t1 = (h + (_rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)) + ((e & f) ^ (~e & g)) +
+              int(SHA256_K[i]) + w[i]) & 0xFFFFFFFF
+        t2 = ((_rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))) & 0xFFFFFFFF
+        h, g, f, e, d, c, b, a = g, f, e, (d + t1) & 0xFFFFFFFF, c, b, a, (t1 + t2) & 0xFFFFFFFF
+
+    return [(int(x) + y) & 0xFFFFFFFF for x, y in zip(state, (a, b, c, d, e, f, g, h))]
+
+
+def _unrolled_rounds() -> str:
+    """Expand the 64 compression rounds as RND() calls with rotating register names."""
+    names = "abcdefgh"
+    rounds = []
+    for i in range(64):
+        regs = [names[(j - i) % 8] for j in range(8)]
+        rounds.append(f"RND({','.join(regs)},{i});")
+    return "\n            ".join(rounds)
+
 
 class GPUHasher:
+    # (platform_info, devices) from the first successful platform scan
+    _platform_cache = None
+
+    # Chunks allowed in flight on the device while streaming
+    STREAM_DEPTH = 2
+
+    # Queues a GPU batch is split across so uploads overlap kernels
+    BATCH_QUEUES = 2
+
+    # Compiled kernel binaries, keyed by source, options and device/driver;
+    # delete this directory to force a rebuild
+    BINARY_CACHE_DIR = os.path.expanduser(os.path.join("~", ".cache", "gpu_hasher", "kernels"))
+
+    # hashlib only releases the GIL for inputs at least this long, so shorter
+    # messages are hashed on the calling thread
+    CPU_PARALLEL_MIN_LENGTH = 2048
+
+    # Longest message that fits in one padded SHA256 block, the only size the
+    # batch kernels take
+    BLOCK_MESSAGE_MAX = 55
+
+    # Messages per tile in the scalar kernel's input; word i of a tile's
+    # messages is contiguous so a warp's loads coalesce
+    SOA_TILE = 32
+
     # OpenCL kernel code
     KERNEL_CODE = """
-    #define ROTRIGHT(word,bits) (((word) >> (bits)) | ((word) << (32-(bits))))
-    #define CH(x,y,z) (((x) & (y)) ^ (~(x) & (z)))
-    #define MAJ(x,y,z) (((x) & (y)) ^ ((x) & (z)) ^ ((y) & (z)))
+    // Word type the macros operate on; redefined as uint4 for the lane kernel
+    #define W uint
+
+    // rotate() and bitselect() map to single rotate / bit-field-insert ops;
+    // on AMD, amd_bitalign is the native funnel shift
+    #if defined(AMD_GCN) && defined(cl_amd_media_ops)
+    #pragma OPENCL EXTENSION cl_amd_media_ops : enable
+    #define ROTRIGHT(word,bits) amd_bitalign((W)(word), (W)(word), (W)(bits))
+    #else
+    #define ROTRIGHT(word,bits) rotate((W)(word), (W)(32u - (bits)))
+    #endif
+    #define CH(x,y,z) bitselect((z), (y), (x))
+    #define MAJ(x,y,z) bitselect((x), (y), (z) ^ (x))
     #define EP0(x) (ROTRIGHT(x,2) ^ ROTRIGHT(x,13) ^ ROTRIGHT(x,22))
     #define EP1(x) (ROTRIGHT(x,6) ^ ROTRIGHT(x,11) ^ ROTRIGHT(x,25))
     #define SIG0(x) (ROTRIGHT(x,7) ^ ROTRIGHT(x,18) ^ ((x) >> 3))
     #define SIG1(x) (ROTRIGHT(x,17) ^ ROTRIGHT(x,19) ^ ((x) >> 10))
 
-    __kernel void sha256_batch(__global const uchar* input,
+    #ifdef __ENDIAN_LITTLE__
+    #define BSWAP(x) as_uint(as_uchar4(x).wzyx)
+    #define BSWAP4(x) as_uint4(as_uchar16(x).s32107654ba98fedc)
+    #else
+    #define BSWAP(x) (x)
+    #define BSWAP4(x) (x)
+    #endif
+
+    // One round, updating d and h in place; callers rotate the argument
+    // order instead of shuffling a..h between rounds
+    #define RND(a,b,c,d,e,f,g,h,i) { \\
+        W t1 = (h) + EP1(e) + CH(e,f,g) + K[i] + w[i]; \\
+        (d) += t1; \\
+        (h) = t1 + EP0(a) + MAJ(a,b,c); \\
+    }
+
+    __constant uint K[64] = {
+        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5,
+        0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+        0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3,
+        0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+        0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc,
+        0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7,
+        0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+        0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13,
+        0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+        0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3,
+        0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5,
+        0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+        0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
+        0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+    };
+
+    __constant uint H0[8] = {
+        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
+        0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+    };
+
+    __kernel void sha256_batch(__global const uint* input,
                            __global uint* output,
-                           const uint batch_size,
-                           const uint input_length) {
-        int gid = get_global_id(0);
-        if (gid >= batch_size) return;
-
-        uint h0 = 0x6a09e667;
-        uint h1 = 0xbb67ae85;
-        uint h2 = 0x3c6ef372;
-        uint h3 = 0xa54ff53a;
-        uint h4 = 0x510e527f;
-        uint h5 = 0x9b05688c;
-        uint h6 = 0x1f83d9ab;
-        uint h7 = 0x5be0cd19;
-
-        uint w[64];
-        uint offset = gid * input_length;
-
-        for (int i = 0; i < 16; i++) {
-            w[i] = (input[offset + 4*i] << 24) |
-                   (input[offset + 4*i + 1] << 16) |
-                   (input[offset + 4*i + 2] << 8) |
-                   (input[offset + 4*i + 3]);
-        }
+                           const uint batch_size) {
+        // Grid-stride loop so one work-item can hash several messages
+        for (uint gid = get_global_id(0); gid < batch_size; gid += get_global_size(0)) {
+            uint w[64];
+
+            // Input is tiled word-major, so neighbouring work-items read
+            // neighbouring words of already big-endian message data
+            __global const uint* tile = input + (gid / SOA_TILE) * 16 * SOA_TILE + gid % SOA_TILE;
+            for (int i = 0; i < 16; i++) {
+                w[i] = tile[i * SOA_TILE];
+            }
+
+            for (int i = 16; i < 64; i++) {
+                w[i] = SIG1(w[i-2]) + w[i-7] + SIG0(w[i-15]) + w[i-16];
+            }
 
-        for (int i = 16; i < 64; i++) {
-            w[i] = SIG1(w[i-2]) + w[i-7] + SIG0(w[i-15]) + w[i-16];
+            uint a = H0[0], b = H0[1], c = H0[2], d = H0[3];
+            uint e = H0[4], f = H0[5], g = H0[6], h = H0[7];
+
+            SHA256_ROUNDS
+
+            // Store big-endian words so the output bytes are the digest itself
+            output[gid*8] = BSWAP(H0[0] + a);
+            output[gid*8 + 1] = BSWAP(H0[1] + b);
+            output[gid*8 + 2] = BSWAP(H0[2] + c);
+            output[gid*8 + 3] = BSWAP(H0[3] + d);
+            output[gid*8 + 4] = BSWAP(H0[4] + e);
+            output[gid*8 + 5] = BSWAP(H0[5] + f);
+            output[gid*8 + 6] = BSWAP(H0[6] + g);
+            output[gid*8 + 7] = BSWAP(H0[7] + h);
         }
+    }
 
-        uint a = h0, b = h1, c = h2, d = h3;
-        uint e = h4, f = h5, g = h6, h = h7;
-
-        const uint k[64] = {
-            0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5,
-            0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
-            0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe,
-            0x9bdc06a7, 0xc19bf174, 0xe49b69c1, 0xefbe4786,
-            0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa,
-            0x5cb0a9dc, 0x76f988da, 0x983e5152, 0xa831c66d,
-            0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147,
-            0x06ca6351, 0x14292967, 0x27b70a85, 0x2e1b2138,
-            0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb,
-            0x81c2c92e, 0x92722c85, 0xa2bfe8a1, 0xa81a664b,
-            0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624,
-            0xf40e3585, 0x106aa070, 0x19a4c116, 0x1e376c08,
-            0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a,
-            0x5b9cca4f, 0x682e6ff3, 0x748f82ee, 0x78a5636f,
-            0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb,
-            0xbef9a3f7, 0xc67178f2
-        };
-
-        for (int i = 0; i < 64; i++) {
-            uint t1 = h + EP1(e) + CH(e,f,g) + k[i] + w[i];
-            uint t2 = EP0(a) + MAJ(a,b,c);
-            h = g; g = f; f = e;
-            e = d + t1;
-            d = c; c = b; b = a;
-            a = t1 + t2;
+    __kernel void sha256_midstate(__global const uint* input,
+                                  __constant uint* midstate,
+                                  __constant uint* schedule,
+                                  const uint first_dirty,
+                                  __global uint* output,
+                                  const uint batch_size) {
+        // Grid-stride loop so one work-item can hash several messages
+        for (uint gid = get_global_id(0); gid < batch_size; gid += get_global_size(0)) {
+            // Tail blocks arrive already padded as 16 big-endian message words
+            uint w[64];
+            for (int i = 0; i < 16; i++) {
+                w[i] = input[gid*16 + i];
+            }
+
+            // Schedule words shared by the whole batch were expanded on the host
+            for (int i = 16; i < first_dirty; i++) {
+                w[i] = schedule[i];
+            }
+
+            for (int i = first_dirty; i < 64; i++) {
+                w[i] = SIG1(w[i-2]) + w[i-7] + SIG0(w[i-15]) + w[i-16];
+            }
+
+            uint a = midstate[0], b = midstate[1], c = midstate[2], d = midstate[3];
+            uint e = midstate[4], f = midstate[5], g = midstate[6], h = midstate[7];
+
+            SHA256_ROUNDS
+
+            // Store big-endian words so the output bytes are the digest itself
+            output[gid*8] = BSWAP(midstate[0] + a);
+            output[gid*8 + 1] = BSWAP(midstate[1] + b);
+            output[gid*8 + 2] = BSWAP(midstate[2] + c);
+            output[gid*8 + 3] = BSWAP(midstate[3] + d);
+            output[gid*8 + 4] = BSWAP(midstate[4] + e);
+            output[gid*8 + 5] = BSWAP(midstate[5] + f);
+            output[gid*8 + 6] = BSWAP(midstate[6] + g);
+            output[gid*8 + 7] = BSWAP(midstate[7] + h);
         }
+    }
+
+    #undef W
+    #define W uint4
+
+    __kernel void sha256_batch4(__global const uint4* input,
+                                __global uint4* output,
+                                const uint group_count) {
+        // Grid-stride loop so one work-item can hash several messages
+        for (uint gid = get_global_id(0); gid < group_count; gid += get_global_size(0)) {
+            // Each lane carries one message; words arrive big-endian and interleaved
+            uint4 w[64];
+            for (int i = 0; i < 16; i++) {
+                w[i] = input[gid*16 + i];
+            }
+
+            for (int i = 16; i < 64; i++) {
+                w[i] = SIG1(w[i-2]) + w[i-7] + SIG0(w[i-15]) + w[i-16];
+            }
+
+            uint4 a = (uint4)(H0[0]), b = (uint4)(H0[1]), c = (uint4)(H0[2]), d = (uint4)(H0[3]);
+            uint4 e = (uint4)(H0[4]), f = (uint4)(H0[5]), g = (uint4)(H0[6]), h = (uint4)(H0[7]);
+
+            SHA256_ROUNDS
 
-        output[gid*8] = h0 + a;
-        output[gid*8 + 1] = h1 + b;
-        output[gid*8 + 2] = h2 + c;
-        output[gid*8 + 3] = h3 + d;
-        output[gid*8 + 4] = h4 + e;
-        output[gid*8 + 5] = h5 + f;
-        output[gid*8 + 6] = h6 + g;
-        output[gid*8 + 7] = h7 + h;
+            // Store big-endian words so the output bytes are the digest itself
+            output[gid*8] = BSWAP4((uint4)(H0[0]) + a);
+            output[gid*8 + 1] = BSWAP4((uint4)(H0[1]) + b);
+            output[gid*8 + 2] = BSWAP4((uint4)(H0[2]) + c);
+            output[gid*8 + 3] = BSWAP4((uint4)(H0[3]) + d);
+            output[gid*8 + 4] = BSWAP4((uint4)(H0[4]) + e);
+            output[gid*8 + 5] = BSWAP4((uint4)(H0[5]) + f);
+            output[gid*8 + 6] = BSWAP4((uint4)(H0[6]) + g);
+            output[gid*8 + 7] = BSWAP4((uint4)(H0[7]) + h);
+        }
     }
-    """
+    """.replace("SHA256_ROUNDS", _unrolled_rounds()).replace("SOA_TILE", str(SOA_TILE))
 
     def __init__(self, enable_cpu=True, enable_gpu=True, enable_npu=True, gpu_threads=256):
         # Clear OpenCL cache before initialization
@@ -110,6 +299,20 @@ class GPUHasher:
         self.max_work_group_size = 256
         self.platform_info = None
         self.available_devices = []
+        self.svm_supported = False
+        self.host_unified_memory = False
+        self.hash_lanes = 1  # Messages per work-item; 4 selects the uint4 kernel
+        self.compute_units = 1
+        self._kernels = {}  # Kernel objects by name, created once per program
+        self._local_sizes = {}  # Work-group size per kernel, from its preferred multiple
+        self._kernel_lock = threading.Lock()  # Kernel args are set and enqueued atomically
+        self._pinned_input = None  # (cl.Buffer, mapped host view) for staging uploads
+        self._scratch = threading.local()  # Per-thread rows for staging mixed-length batches
+        self._buffer_pool = {}  # Device buffers reused across calls, keyed by role
+        self._batch_queues = []  # Persistent queues the batch path splits work across
+        self._dispatch_lock = threading.Lock()  # Serializes batches sharing pooled buffers
+        self._stream_ids = count()
+        self._cpu_pool = None  # Thread pool for hashlib on long messages, created on demand
 
         try:
             self._initialize_accelerator()
@@ -119,6 +322,12 @@ class GPUHasher:
 
     def _detect_available_platforms(self):
         """Detect all available OpenCL platforms and their devices."""
+        # Platform enumeration is process-wide; reuse it across instances
+        if GPUHasher._platform_cache is not None:
+            platform_info, available_devices = GPUHasher._platform_cache
+            self.available_devices.extend(available_devices)
+            return platform_info
+
         try:
             platforms = cl.get_platforms()
             platform_info = []
@@ -129,23 +338,25 @@ class GPUHasher:
                     platform_version = platform.version
                     devices = []
 
-                    # Try to get all types of devices
-                    for device_type in [cl.device_type.GPU, cl.device_type.CPU, cl.device_type.ACCELERATOR]:
+                    # Query every device once and dispatch on its type
+                    for device in platform.get_devices(device_type=cl.device_type.ALL):
                         try:
-                            platform_devices = platform.get_devices(device_type=device_type)
-                            for device in platform_devices:
-                                device_info = {
-                                    'name': device.name,
-                                    'type': device_type,
-                                    'vendor': device.vendor,
-                                    'version': device.version,
-                                    'compute_units': device.max_compute_units,
-                                    'global_mem': device.global_mem_size,
-                                    'local_mem': device.local_mem_size,
-                                    'max_work_group_size': device.max_work_group_size
-                                }
-                                devices.append(device_info)
-                                self.available_devices.append(device)
+                            device_type = device.type
+                            if device_type not in (cl.device_type.GPU, cl.device_type.CPU,
+                                                   cl.device_type.ACCELERATOR):
+                                continue
+                            device_info = {
+                                'name': device.name,
+                                'type': device_type,
+                                'vendor': device.vendor,
+                                'version': device.version,
+                                'compute_units': device.max_compute_units,
+                                'global_mem': device.global_mem_size,
+                                'local_mem': device.local_mem_size,
+                                'max_work_group_size': device.max_work_group_size
+                            }
+                            devices.append(device_info)
+                            self.available_devices.append(device)
                         except:
                             continue
 
@@ -157,6 +368,8 @@ class GPUHasher:
                 except:
                     continue
 
+            if platform_info:
+                GPUHasher._platform_cache = (platform_info, list(self.available_devices))
             return platform_info
         except:
             return []
@@ -184,6 +397,15 @@ class GPUHasher:
                     logging.info(f"    Vendor: {device['vendor']}")
                     logging.info(f"    Compute Units: {device['compute_units']}")
 
+            # Only consider devices that meet the minimum requirements, so a
+            # weak device is skipped in favour of the next candidate
+            self.available_devices = [
+                device for device in self.available_devices
+                if self._device_meets_requirements(device)
+            ]
+
+            selected_device = None
+            build_options = []
 
             # First, try to find Qualcomm GPU
             if self.enable_gpu:
@@ -208,7 +430,11 @@ class GPUHasher:
                 selected_device = self._find_best_gpu()
                 if selected_device:
                     logging.info(f"Selected GPU device: {selected_device.name}")
-                    build_options = []
+                    build_options = [
+                        "-cl-mad-enable",
+                        "-cl-unsafe-math-optimizations",
+                        "-cl-denorms-are-zero"
+                    ]
 
             # Finally, fall back to CPU if needed
             if not selected_device and self.enable_cpu:
@@ -222,31 +448,44 @@ class GPUHasher:
                 self._fallback_to_cpu()
                 return
 
+            build_options = build_options + self._vendor_defines(selected_device)
+
             # Initialize OpenCL context and command queue with error checking
             try:
                 self.ctx = cl.Context([selected_device])
                 self.queue = cl.CommandQueue(self.ctx)
+                self._batch_queues = [cl.CommandQueue(self.ctx) for _ in range(self.BATCH_QUEUES)]
 
                 # Build program with detailed error handling
                 try:
-                    self.program = cl.Program(self.ctx, self.KERNEL_CODE)
-                    logging.info("Created OpenCL program, attempting to build...")
-                    self.program.build(options=build_options)
-                    logging.info("Successfully built OpenCL program")
+                    self.program = self._build_program(selected_device, build_options)
                 except cl.RuntimeError as e:
                     logging.error(f"OpenCL build error: {e}")
-                    logging.error(f"Build log: {self.program.get_build_info(selected_device, cl.program_build_info.LOG)}")
                     raise
 
                 # Update device configuration
                 self.max_work_group_size = min(256, selected_device.max_work_group_size)
                 self.device_type = "GPU" if selected_device.type in [cl.device_type.GPU, cl.device_type.ACCELERATOR] else "CPU"
+                self.svm_supported = self._supports_svm(selected_device)
+                self.host_unified_memory = self._has_unified_memory(selected_device)
+                # Devices with native 4-wide integer SIMD hash four messages per work-item
+                self.hash_lanes = 4 if selected_device.native_vector_width_int >= 4 else 1
+                self.compute_units = selected_device.max_compute_units
+                self._kernels = {kernel.function_name: kernel for kernel in self.program.all_kernels()}
+                self._local_sizes = {
+                    name: self._kernel_local_size(kernel, selected_device)
+                    for name, kernel in self._kernels.items()
+                }
 
                 logging.info(f"Device initialization complete:")
                 logging.info(f"- Device: {selected_device.name}")
                 logging.info(f"- Type: {self.device_type}")
                 logging.info(f"- Work group size: {self.max_work_group_size}")
                 logging.info(f"- Compute units: {selected_device.max_compute_units}")
+                logging.info(f"- Shared virtual memory: {self.svm_supported}")
+                logging.info(f"- Unified host memory: {self.host_unified_memory}")
+                logging.info(f"- Messages per work-item: {self.hash_lanes}")
+                logging.info(f"- Kernel work-group sizes: {self._local_sizes}")
 
             except cl.RuntimeError as e:
                 logging.error(f"OpenCL initialization error: {str(e)}")
@@ -256,6 +495,72 @@ class GPUHasher:
             logging.error(f"Accelerator initialization failed: {str(e)}")
             self._fallback_to_cpu()
 
+    def _build_program(self, device, build_options: List[str]) -> cl.Program:
+        """Build the kernel program, reusing a compiled binary from disk when one matches."""
+        key = hashlib.sha256("\0".join([
+            self.KERNEL_CODE, " ".join(build_options),
+            device.name, device.vendor, device.version, device.driver_version,
+            device.platform.version
+        ]).encode()).hexdigest()
+        cache_path = os.path.join(self.BINARY_CACHE_DIR, f"sha256_{key}.bin")
+
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    program = cl.Program(self.ctx, [device], [f.read()])
+                program.build(options=build_options)
+                logging.info("Loaded OpenCL program from binary cache")
+                return program
+            except Exception as e:
+                logging.warning(f"Ignoring unusable kernel binary cache entry: {e}")
+
+        program = cl.Program(self.ctx, self.KERNEL_CODE)
+        logging.info("Created OpenCL program, attempting to build...")
+        try:
+            program.build(options=build_options)
+        except cl.RuntimeError:
+            logging.error(f"Build log: {program.get_build_info(device, cl.program_build_info.LOG)}")
+            raise
+        logging.info("Successfully built OpenCL program")
+
+        try:
+            os.makedirs(self.BINARY_CACHE_DIR, exist_ok=True)
+            # Write then rename so concurrent instances never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(program.binaries[0])
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logging.warning(f"Failed to cache kernel binary: {e}")
+
+        return program
+
+    @staticmethod
+    def _vendor_defines(device) -> List[str]:
+        """Build options defining the vendor macro the kernel's fast paths test for."""
+        # Only AMD GPUs have a dedicated path (amd_bitalign). Matching "amd"
+        # alone would also catch CPU vendor strings such as "AuthenticAMD"
+        if device.type & cl.device_type.GPU and "advanced micro devices" in device.vendor.lower():
+            return ["-D", "AMD_GCN=1"]
+        return []
+
+    def _kernel_local_size(self, kernel, device) -> int:
+        """Pick a work-group size that is a multiple of the kernel's preferred size multiple."""
+        target = min(self.max_work_group_size, 256 if self.device_type == "GPU" else 64)
+        try:
+            multiple = kernel.get_work_group_info(
+                cl.kernel_work_group_info.PREFERRED_WORK_GROUP_SIZE_MULTIPLE, device)
+            limit = min(self.max_work_group_size, kernel.get_work_group_info(
+                cl.kernel_work_group_info.WORK_GROUP_SIZE, device))
+        except cl.Error:
+            return target
+
+        # Round up to the preferred multiple, backing off while the kernel can't launch it
+        local_size = -(-target // multiple) * multiple
+        while local_size > limit and local_size > multiple:
+            local_size -= multiple
+        return max(1, min(local_size, limit))
+
     def _find_qualcomm_device(self) -> Optional[cl.Device]:
         """Find Qualcomm GPU/NPU device."""
         for device in self.available_devices:
@@ -272,16 +577,27 @@ class GPUHasher:
         return None
 
     def _find_best_gpu(self) -> Optional[cl.Device]:
-        """Find the best available GPU device."""
+        """Find the best available GPU (or NPU accelerator) device."""
         best_device = None
-        max_compute_units = 0
+        best_score = None
 
         for device in self.available_devices:
             try:
-                if device.type == cl.device_type.GPU:
-                    if device.max_compute_units > max_compute_units:
-                        best_device = device
-                        max_compute_units = device.max_compute_units
+                is_accelerator = device.type == cl.device_type.ACCELERATOR
+                if device.type != cl.device_type.GPU and not (is_accelerator and self.enable_npu):
+                    continue
+
+                # Rank NPUs above GPUs, then by raw integer throughput,
+                # using the global memory cache size as a tie-breaker
+                throughput = (
+                    device.max_compute_units *
+                    max(device.max_clock_frequency, 1) *
+                    max(getattr(device, 'preferred_vector_width_int', 1), 1)
+                )
+                score = (is_accelerator, throughput, device.global_mem_cache_size)
+                if best_score is None or score > best_score:
+                    best_device = device
+                    best_score = score
             except:
                 continue
 
@@ -304,6 +620,15 @@ class GPUHasher:
         self.enable_npu = False
         logging.warning("Falling back to CPU-only mode")
 
+    @staticmethod
+    def _device_version(device) -> tuple:
+        """Parse the (major, minor) OpenCL version from 'OpenCL <major>.<minor> ...'."""
+        version = device.version.split()
+        if len(version) >= 2:
+            major, minor = version[1].split('.')[:2]
+            return int(major), int(minor)
+        return 0, 0
+
     def _verify_device_capabilities(self, device):
         """Verify if device meets minimum requirements."""
         try:
@@ -314,16 +639,40 @@ class GPUHasher:
             if device.max_compute_units < 1:
                 raise RuntimeError("Device has no compute units")
 
-            version = device.version.split()
-            if len(version) >= 2:
-                major, minor = map(int, version[1].split('.'))
-                if major < 1 or (major == 1 and minor < 1):
-                    raise RuntimeError(f"OpenCL version {version[1]} not supported. Minimum required: 1.2")
+            major, minor = self._device_version(device)
+            if (major, minor) < (1, 2):
+                raise RuntimeError(f"OpenCL version {major}.{minor} not supported. Minimum required: 1.2")
 
         except Exception as e:
             logging.error(f"Device capability verification failed: {str(e)}")
             raise
 
+    def _device_meets_requirements(self, device) -> bool:
+        """Check a candidate device before selection, logging why it is skipped."""
+        try:
+            self._verify_device_capabilities(device)
+            return True
+        except Exception:
+            logging.warning(f"Skipping device {device.name}: does not meet minimum requirements")
+            return False
+
+    def _supports_svm(self, device) -> bool:
+        """Check for OpenCL 2.0+ coarse-grain shared virtual memory."""
+        try:
+            if self._device_version(device) < (2, 0):
+                return False
+            return bool(device.svm_capabilities & cl.device_svm_capabilities.COARSE_GRAIN_BUFFER)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _has_unified_memory(device) -> bool:
+        """Check whether the device shares physical memory with the host."""
+        try:
+            return bool(device.host_unified_memory)
+        except Exception:
+            return False
+
     def set_gpu_threads(self, thread_count: int):
         """Update GPU thread count within device limits."""
         if self.ctx and self.device_type in ("GPU", "NPU"):
@@ -333,86 +682,484 @@ class GPUHasher:
             self.max_work_group_size = min(256, device.max_work_group_size)
             logging.info(f"GPU threads set to {self.gpu_threads} (max work group size: {self.max_work_group_size})")
 
-    def compute_hash_batch(self, data_batch: List[bytes], input_length: int = 64) -> List[bytes]:
-        """Compute SHA256 hashes optimized for GPU processing."""
+    def compute_hash_batch(self, data_batch: List[bytes]) -> List[bytes]:
+        """Compute SHA256 digests of messages of any length, in order."""
+        # CPU devices hash natively; hashlib uses SHA-NI through OpenSSL where available
+        if self.device_type == "CPU":
+            return self._compute_hash_batch_cpu(data_batch)
+
         if not self.ctx:
             raise RuntimeError("Hardware acceleration not initialized")
 
-        try:
-            batch_size = len(data_batch)
+        if not data_batch:
+            return []
 
-            # Optimize work group size based on device type
-            if self.device_type == "GPU":
-                local_size = min(self.max_work_group_size, 256)
-            else:
-                local_size = min(self.max_work_group_size, 64)
+        # The kernels take single-block messages; longer ones go to hashlib
+        if max(map(len, data_batch)) > self.BLOCK_MESSAGE_MAX:
+            short = [data for data in data_batch if len(data) <= self.BLOCK_MESSAGE_MAX]
+            device_digests = iter(self._compute_hash_batch_device(short) if short else ())
+            return [next(device_digests) if len(data) <= self.BLOCK_MESSAGE_MAX
+                    else hashlib.sha256(data).digest() for data in data_batch]
 
-            # Calculate optimal global size
-            global_size = max(
-                ((batch_size + local_size - 1) // local_size) * local_size,
-                self.gpu_threads
-            )
+        return self._compute_hash_batch_device(data_batch)
+
+    def _compute_hash_batch_device(self, data_batch: List[bytes]) -> List[bytes]:
+        """Compute SHA256 digests of single-block messages on the OpenCL device."""
+        # Pooled buffers and the pinned staging area are shared by every
+        # caller, so device batches from concurrent threads run one at a time
+        with self._dispatch_lock:
+            if self.svm_supported:
+                return self._compute_hash_batch_svm(data_batch)
+
+            # Integrated GPUs and NPUs share host memory, so skip the device copy
+            if self.host_unified_memory:
+                return self._compute_hash_batch_zero_copy(data_batch)
 
-            input_buffer = np.zeros((batch_size, input_length), dtype=np.uint8)
-            for i, data in enumerate(data_batch):
-                input_buffer[i, :len(data)] = np.frombuffer(data, dtype=np.uint8)
+            return self._compute_hash_batch_queues(data_batch)
 
-            output_buffer = np.zeros((batch_size, 32), dtype=np.uint32)
+    def _compute_hash_batch_queues(self, data_batch: List[bytes]) -> List[bytes]:
+        """Compute SHA256 hashes on a discrete device, split across the batch queues."""
+        try:
+            batch_size = len(data_batch)
+            rows = self._batch_rows(batch_size)
+            input_buffer = self._stage_batch(data_batch, self._pinned_rows(rows))
+
+            # One SHA256 digest is 8 uint32 words (32 bytes) per hash
+            output_buffer = np.empty((rows, 8), dtype=np.uint32)
 
             # Use multiple command queues for better parallelism on GPU
-            num_queues = 2 if self.device_type == "GPU" else 1
-            queues = [cl.CommandQueue(self.ctx) for _ in range(num_queues)]
+            queues = self._batch_queues if self.device_type == "GPU" else [self.queue]
+            num_queues = len(queues)
 
-            # Split work across multiple queues
-            split_points = [(i * batch_size) // num_queues for i in range(num_queues + 1)]
-            results = []
+            # Split work across multiple queues on whole staged groups
+            groups = rows // self._group_rows
+            split_points = [(i * groups) // num_queues * self._group_rows for i in range(num_queues + 1)]
+            readbacks = []
 
             for q_idx in range(num_queues):
                 start, end = split_points[q_idx], split_points[q_idx + 1]
                 if start == end:
                     continue
 
-                input_gpu = cl.Buffer(
-                    self.ctx,
-                    cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR,
-                    hostbuf=input_buffer[start:end]
-                )
-                output_gpu = cl.Buffer(
-                    self.ctx,
-                    cl.mem_flags.WRITE_ONLY,
-                    size=output_buffer[start:end].nbytes
-                )
+                input_gpu = self._pooled_buffer(('input', q_idx), input_buffer[start:end].nbytes,
+                                                cl.mem_flags.READ_ONLY)
+                output_gpu = self._pooled_buffer(('output', q_idx), output_buffer[start:end].nbytes,
+                                                 cl.mem_flags.WRITE_ONLY)
 
-                try:
-                    # Execute kernel with optimized work group size
-                    self.program.sha256_batch(
-                        queues[q_idx],
-                        (global_size,),
-                        (local_size,),
-                        input_gpu,
-                        output_gpu,
-                        np.uint32(end - start),
-                        np.uint32(input_length)
-                    )
-
-                    # Copy results back
-                    cl.enqueue_copy(queues[q_idx], output_buffer[start:end], output_gpu)
-
-                finally:
-                    input_gpu.release()
-                    output_gpu.release()
-
-            # Convert results to bytes
-            for i in range(batch_size):
-                hash_value = output_buffer[i].tobytes()
-                results.append(hash_value)
+                # Upload straight from pinned memory so the driver can DMA it
+                cl.enqueue_copy(queues[q_idx], input_gpu, input_buffer[start:end], is_blocking=False)
 
-            return results
+                self._launch(queues[q_idx], end - start, input_gpu, output_gpu)
+
+                # Read back without blocking so the next slice's upload is
+                # already queued while this one computes
+                readbacks.append(cl.enqueue_copy(queues[q_idx], output_buffer[start:end], output_gpu,
+                                                 is_blocking=False))
+                queues[q_idx].flush()
+
+            cl.wait_for_events(readbacks)
+            return self._split_digests(self._unstage_output(output_buffer)[:batch_size])
 
         except cl.RuntimeError as e:
             logging.error(f"OpenCL error in hash computation: {str(e)}")
             raise
 
+    def _compute_hash_batch_svm(self, data_batch: List[bytes]) -> List[bytes]:
+        """Compute SHA256 hashes through coarse-grain SVM, without explicit buffer copies."""
+        batch_size = len(data_batch)
+        rows = self._batch_rows(batch_size)
+
+        try:
+            input_svm = cl.SVM(self._pooled_svm('svm_input', rows, 64, np.uint8))
+            output_svm = cl.SVM(self._pooled_svm('svm_output', rows, 8, np.uint32))
+
+            # Stage messages directly in the shared allocation
+            with input_svm.map_rw(self.queue) as host_input:
+                self._stage_batch(data_batch, host_input)
+
+            self._launch(self.queue, rows, input_svm, output_svm)
+
+            with output_svm.map_ro(self.queue) as host_output:
+                return self._split_digests(self._unstage_output(host_output)[:batch_size])
+
+        except cl.RuntimeError as e:
+            logging.error(f"OpenCL error in SVM hash computation: {str(e)}")
+            raise
+
+    def _compute_hash_batch_zero_copy(self, data_batch: List[bytes]) -> List[bytes]:
+        """Compute SHA256 hashes in host-allocated buffers the device reads in place."""
+        batch_size = len(data_batch)
+        rows = self._batch_rows(batch_size)
+
+        try:
+            input_buf = self._pooled_buffer('host_input', rows * 64,
+                                            cl.mem_flags.READ_ONLY | cl.mem_flags.ALLOC_HOST_PTR)
+            output_buf = self._pooled_buffer('host_output', rows * 32,
+                                             cl.mem_flags.WRITE_ONLY | cl.mem_flags.ALLOC_HOST_PTR)
+
+            # Stage through a mapping; on unified memory map/unmap moves no data
+            host_input, _ = cl.enqueue_map_buffer(
+                self.queue, input_buf, cl.map_flags.WRITE_INVALIDATE_REGION, 0, (rows, 64), np.uint8
+            )
+            self._stage_batch(data_batch, host_input)
+            host_input.base.release(self.queue)
+
+            self._launch(self.queue, rows, input_buf, output_buf)
+
+            host_output, _ = cl.enqueue_map_buffer(
+                self.queue, output_buf, cl.map_flags.READ, 0, (rows, 8), np.uint32
+            )
+            try:
+                return self._split_digests(self._unstage_output(host_output)[:batch_size])
+            finally:
+                host_output.base.release(self.queue)
+
+        except cl.RuntimeError as e:
+            logging.error(f"OpenCL error in zero-copy hash computation: {str(e)}")
+            raise
+
+    def compute_hash_batch_with_prefix(self, prefix: bytes, tails: List[bytes]) -> List[bytes]:
+        """Compute SHA256(prefix + tail) for every tail, sharing the prefix midstate.
+
+        The prefix must be whole 64-byte blocks; it is compressed once on the
+        host and each work-item only runs the final block holding its tail.
+        Digests are returned in standard SHA256 byte order.
+        """
+        if len(prefix) % 64:
+            raise ValueError("Prefix length must be a multiple of 64 bytes")
+        if any(len(tail) > 55 for tail in tails):
+            raise ValueError("Tails must fit in a single padded block (55 bytes max)")
+
+        if not tails:
+            return []
+
+        if self.device_type == "CPU" or not self.ctx:
+            base = hashlib.sha256(prefix)
+            results = []
+            for tail in tails:
+                h = base.copy()
+                h.update(tail)
+                results.append(h.digest())
+            return results
+
+        with self._dispatch_lock:
+            return self._compute_hash_batch_midstate(prefix, tails)
+
+    def _compute_hash_batch_midstate(self, prefix: bytes, tails: List[bytes]) -> List[bytes]:
+        """Run sha256_midstate over padded tails that share a compressed prefix."""
+        midstate = SHA256_H0
+        for i in range(0, len(prefix), 64):
+            midstate = _sha256_compress(midstate, prefix[i:i + 64])
+        midstate = np.array(midstate, dtype=np.uint32)
+
+        batch_size = len(tails)
+        input_words = self._prepare_input(tails, len(prefix)).view('>u4').astype(np.uint32)
+        schedule, first_dirty = _shared_schedule(input_words)
+
+        output_buffer = np.empty((batch_size, 8), dtype=np.uint32)
+
+        input_gpu = self._pooled_buffer('midstate_input', input_words.nbytes, cl.mem_flags.READ_ONLY)
+        midstate_gpu = self._pooled_buffer('midstate', midstate.nbytes, cl.mem_flags.READ_ONLY)
+        schedule_gpu = self._pooled_buffer('schedule', schedule.nbytes, cl.mem_flags.READ_ONLY)
+        output_gpu = self._pooled_buffer('midstate_output', output_buffer.nbytes, cl.mem_flags.WRITE_ONLY)
+
+        try:
+            cl.enqueue_copy(self.queue, input_gpu, input_words, is_blocking=False)
+            cl.enqueue_copy(self.queue, midstate_gpu, midstate, is_blocking=False)
+            cl.enqueue_copy(self.queue, schedule_gpu, schedule, is_blocking=False)
+            self._enqueue_kernel(
+                'sha256_midstate',
+                self.queue,
+                batch_size,
+                input_gpu,
+                midstate_gpu,
+                schedule_gpu,
+                np.uint32(first_dirty),
+                output_gpu,
+                np.uint32(batch_size)
+            )
+            cl.enqueue_copy(self.queue, output_buffer, output_gpu)
+
+        except cl.RuntimeError as e:
+            logging.error(f"OpenCL error in midstate hash computation: {str(e)}")
+            raise
+
+        return self._split_digests(output_buffer)
+
+    def compute_hash_stream(self, data_iter: Iterable[bytes], chunk: int = 4096) -> Iterator[bytes]:
+        """Compute SHA256 hashes for a stream of messages, yielding digests in order.
+
+        The next chunk is staged on the host while the previous one is still
+        running on the device, so producers that hand over an iterator get
+        host preparation and GPU execution overlapped.
+        """
+        data_iter = iter(data_iter)
+        chunks = iter(lambda: list(islice(data_iter, chunk)), [])
+
+        if self.device_type == "CPU" or not self.ctx:
+            for data_batch in chunks:
+                yield from self.compute_hash_batch(data_batch)
+            return
+
+        # Buffer slots are private to this stream so concurrent streams on a
+        # shared hasher never overwrite each other's chunks
+        stream_id = next(self._stream_ids)
+        slots = [(stream_id, slot) for slot in range(self.STREAM_DEPTH + 1)]
+        in_flight = deque()
+        try:
+            for index, data_batch in enumerate(chunks):
+                if max(map(len, data_batch)) > self.BLOCK_MESSAGE_MAX:
+                    # Chunks with multi-block messages are hashed in order
+                    # once the ones ahead of them are collected
+                    while in_flight:
+                        yield from self._collect_batch(*in_flight.popleft())
+                    yield from self.compute_hash_batch(data_batch)
+                    continue
+
+                # At most STREAM_DEPTH chunks are still pending here, so the
+                # buffer slot of the chunk before them is free to reuse
+                in_flight.append(self._enqueue_batch(data_batch, slots[index % len(slots)]))
+
+                # Hand back every chunk that already finished, and block on the
+                # oldest one only once the pipeline is full
+                while in_flight and (len(in_flight) > self.STREAM_DEPTH or
+                                     in_flight[0][1].command_execution_status == cl.command_execution_status.COMPLETE):
+                    yield from self._collect_batch(*in_flight.popleft())
+
+            while in_flight:
+                yield from self._collect_batch(*in_flight.popleft())
+        finally:
+            # Let abandoned chunks finish before their buffers are released
+            for _, event, _ in in_flight:
+                event.wait()
+            for slot in slots:
+                for role in ('stream_input', 'stream_output'):
+                    buffer = self._buffer_pool.pop((role, slot), None)
+                    if buffer is not None:
+                        buffer.release()
+
+    def _enqueue_batch(self, data_batch: List[bytes], slot):
+        """Enqueue upload, kernel and non-blocking readback for one stream chunk."""
+        rows = self._batch_rows(len(data_batch))
+        input_buffer = self._stage_batch(data_batch, np.empty((rows, 64), dtype=np.uint8))
+        output_buffer = np.empty((rows, 8), dtype=np.uint32)
+
+        input_gpu = self._pooled_buffer(('stream_input', slot), input_buffer.nbytes, cl.mem_flags.READ_ONLY)
+        output_gpu = self._pooled_buffer(('stream_output', slot), output_buffer.nbytes, cl.mem_flags.WRITE_ONLY)
+
+        cl.enqueue_copy(self.queue, input_gpu, input_buffer, is_blocking=False)
+        self._launch(self.queue, rows, input_gpu, output_gpu)
+        event = cl.enqueue_copy(self.queue, output_buffer, output_gpu, is_blocking=False)
+        self.queue.flush()
+        return output_buffer, event, len(data_batch)
+
+    def _collect_batch(self, output_buffer, event, batch_size) -> List[bytes]:
+        """Wait for a stream chunk's readback and split it into digests."""
+        event.wait()
+        return self._split_digests(self._unstage_output(output_buffer)[:batch_size])
+
+    @property
+    def _group_rows(self) -> int:
+        """Messages per interleaved group in the staged input layout."""
+        return self.hash_lanes if self.hash_lanes > 1 else self.SOA_TILE
+
+    def _batch_rows(self, batch_size: int) -> int:
+        """Rows to stage for a batch, rounded up to whole groups."""
+        return -(-batch_size // self._group_rows) * self._group_rows
+
+    def _stage_batch(self, data_batch: List[bytes], out: np.ndarray) -> np.ndarray:
+        """Fill a (rows, 64) staging array in the layout the selected kernel reads."""
+        # Big-endian words are interleaved so word i of a group's messages is
+        # contiguous: one uintN for the lane kernel, one coalesced load per
+        # tile for the scalar kernel
+        width = self._group_rows
+        words = np.reshape(out.view(np.uint32), (len(out) // width, 16, width), copy=False).transpose(0, 2, 1)
+
+        # Rows past the batch only round it up to whole groups and their
+        # digests are dropped, so they are left unfilled
+        full, rest = divmod(len(data_batch), width)
+        pieces = [(words[:full], slice(0, full * width))]
+        if rest:
+            pieces.append((words[full, :rest], slice(full * width, len(data_batch))))
+
+        lengths = np.fromiter(map(len, data_batch), dtype=np.int64, count=len(data_batch))
+        if len(lengths) and lengths.min() == lengths.max():
+            self._stage_uniform(data_batch, int(lengths[0]), pieces)
+            return out
+
+        # Mixed lengths are padded row by row first, then interleaved in one copy
+        blocks = self._scratch_rows(len(data_batch))
+        self._prepare_input(data_batch, out=blocks, lengths=lengths)
+        source = blocks.view('>u4')
+        for target, rows in pieces:
+            target[...] = source[rows].reshape(target.shape)
+        return out
+
+    @staticmethod
+    def _stage_uniform(data_batch: List[bytes], length: int, pieces):
+        """Write equal-length messages as padded big-endian words straight into the staging layout."""
+        if length > 55:
+            raise ValueError("Messages must fit in a single padded block (55 bytes max)")
+
+        whole, tail = divmod(length, 4)
+        messages = np.frombuffer(b''.join(data_batch), dtype=np.uint8).reshape(len(data_batch), length)
+        message_words = messages[:, :whole * 4].view('>u4')
+
+        # The word the message ends in carries its last bytes and the 0x80 terminator
+        last_word = np.full(len(data_batch), 0x80 << (8 * (3 - tail)), dtype=np.uint32)
+        for i in range(tail):
+            last_word |= messages[:, whole * 4 + i].astype(np.uint32) << np.uint32(8 * (3 - i))
+
+        bit_length = length * 8
+        for target, rows in pieces:
+            shape = target.shape[:-1]
+            target[..., :whole] = message_words[rows].reshape(*shape, whole)
+            target[..., whole] = last_word[rows].reshape(shape)
+            target[..., whole + 1:14] = 0
+            target[..., 14] = bit_length >> 32
+            target[..., 15] = bit_length & 0xFFFFFFFF
+
+    def _scratch_rows(self, batch_size: int) -> np.ndarray:
+        """Return (batch_size, 64) rows of this thread's reusable staging scratch."""
+        rows = getattr(self._scratch, 'rows', None)
+        if rows is None or len(rows) < batch_size:
+            rows = np.empty((1 << max(batch_size - 1, 0).bit_length(), 64), dtype=np.uint8)
+            self._scratch.rows = rows
+        return rows[:batch_size]
+
+    def _unstage_output(self, output_buffer: np.ndarray) -> np.ndarray:
+        """Return (rows, 8) digest words in message order from kernel output."""
+        if self.hash_lanes == 1:
+            return output_buffer
+        lanes = self.hash_lanes
+        return output_buffer.reshape(-1, 8, lanes).transpose(0, 2, 1).reshape(-1, 8)
+
+    def _launch(self, queue, rows: int, input_buf, output_buf):
+        """Enqueue the batch kernel for the selected lane width over staged rows."""
+        work_items = rows // self.hash_lanes
+        if self.hash_lanes == 1:
+            self._enqueue_kernel('sha256_batch', queue, work_items,
+                                 input_buf, output_buf, np.uint32(work_items))
+        else:
+            self._enqueue_kernel('sha256_batch4', queue, work_items,
+                                 input_buf, output_buf, np.uint32(work_items))
+
+    def _enqueue_kernel(self, name: str, queue, work_items: int, *args) -> cl.Event:
+        """Enqueue a cached kernel sized for work_items."""
+        global_size, local_size = self._work_sizes(work_items, name)
+        kernel = self._kernels[name]
+        with self._kernel_lock:
+            return kernel(queue, (global_size,), (local_size,), *args)
+
+    def _work_sizes(self, batch_size: int, kernel: str = 'sha256_batch'):
+        """Pick (global_size, local_size) for a batch of the given size."""
+        local_size = self._local_sizes.get(kernel)
+        if not local_size:
+            local_size = min(self.max_work_group_size, 256 if self.device_type == "GPU" else 64)
+
+        # Keep several work-groups queued on every compute unit, and only once
+        # that is reached let each work-item loop over more than one message
+        messages_per_item = max(1, batch_size // (local_size * self.compute_units * 4))
+        work_items = (batch_size + messages_per_item - 1) // messages_per_item
+
+        # Apply the gpu_threads floor before rounding: OpenCL 1.2 requires the
+        # global size to be a multiple of the local size, which need not divide it
+        global_size = max(work_items, self.gpu_threads)
+        global_size = -(-global_size // local_size) * local_size
+        return global_size, local_size
+
+    def _pooled_buffer(self, key, nbytes: int, flags) -> cl.Buffer:
+        """Return a cached device buffer of at least nbytes, growing it to the next power of two."""
+        buffer = self._buffer_pool.get(key)
+        if buffer is None or buffer.size < nbytes:
+            if buffer is not None:
+                buffer.release()
+            buffer = cl.Buffer(self.ctx, flags, size=1 << max(nbytes - 1, 0).bit_length())
+            self._buffer_pool[key] = buffer
+        return buffer
+
+    def _pooled_svm(self, key, rows: int, width: int, dtype) -> np.ndarray:
+        """Return a (rows, width) view into a cached SVM allocation with power-of-two capacity."""
+        array = self._buffer_pool.get(key)
+        if array is None or len(array) < rows:
+            array = cl.csvm_empty(self.ctx, (1 << max(rows - 1, 0).bit_length(), width), dtype)
+            self._buffer_pool[key] = array
+        return array[:rows]
+
+    def _pinned_rows(self, batch_size: int) -> np.ndarray:
+        """Return a (batch_size, 64) view into the persistently mapped pinned staging buffer."""
+        if self._pinned_input is None or len(self._pinned_input[1]) < batch_size:
+            if self._pinned_input is not None:
+                self._pinned_input[1].base.release(self.queue)
+                self._pinned_input[0].release()
+
+            # Grow in powers of two so steady-state batches never reallocate
+            capacity = 1 << max(batch_size - 1, 0).bit_length()
+            pinned = cl.Buffer(self.ctx, cl.mem_flags.READ_WRITE | cl.mem_flags.ALLOC_HOST_PTR,
+                               size=capacity * 64)
+            host_view, _ = cl.enqueue_map_buffer(
+                self.queue, pinned, cl.map_flags.READ | cl.map_flags.WRITE,
+                0, (capacity, 64), np.uint8
+            )
+            self._pinned_input = (pinned, host_view)
+
+        return self._pinned_input[1][:batch_size]
+
+    @staticmethod
+    def _prepare_input(data_batch: List[bytes], prefix_length: int = 0,
+                       out: Optional[np.ndarray] = None, lengths: Optional[np.ndarray] = None) -> np.ndarray:
+        """Stage messages as SHA256-padded single 64-byte blocks."""
+        if lengths is None:
+            lengths = np.fromiter(map(len, data_batch), dtype=np.int64, count=len(data_batch))
+        if len(lengths) and lengths.max() > 55:
+            raise ValueError("Messages must fit in a single padded block (55 bytes max)")
+
+        input_buffer = out if out is not None else np.empty((len(data_batch), 64), dtype=np.uint8)
+        data = np.frombuffer(b''.join(data_batch), dtype=np.uint8)
+
+        if len(lengths) and lengths.min() == lengths.max():
+            # Uniform lengths: the joined bytes already form the message
+            # columns, and only the gap before the length field needs zeroing
+            length = int(lengths[0])
+            input_buffer[:, :length] = data.reshape(len(data_batch), length)
+            input_buffer[:, length] = 0x80
+            input_buffer[:, length + 1:56] = 0
+            input_buffer[:, 56:] = np.frombuffer(((length + prefix_length) * 8).to_bytes(8, 'big'), dtype=np.uint8)
+            return input_buffer
+
+        # Columns from 56 on always hold the length, so only zero the rest;
+        # then scatter the concatenated messages into their rows in one copy,
+        # a row-major boolean mask visiting the bytes in the same order
+        rows = np.arange(len(data_batch))
+        input_buffer[:, :56] = 0
+        input_buffer[np.arange(64) < lengths[:, None]] = data
+        input_buffer[rows, lengths] = 0x80
+        input_buffer[:, 56:] = ((lengths + prefix_length) * 8).astype('>u8').view(np.uint8).reshape(-1, 8)
+        return input_buffer
+
+    @staticmethod
+    def _split_digests(output_buffer: np.ndarray) -> List[bytes]:
+        """Split (batch_size, 8) kernel output, already big-endian, into 32-byte digests."""
+        # Viewing each 32-byte row as a void scalar lets tolist() emit the
+        # bytes objects in C instead of slicing them out one by one
+        return np.ascontiguousarray(output_buffer).view('V32').ravel().tolist()
+
+    def _compute_hash_batch_cpu(self, data_batch: List[bytes]) -> List[bytes]:
+        """Compute SHA256 hashes natively with hashlib, bypassing OpenCL."""
+        workers = os.cpu_count() or 1
+        total_length = sum(map(len, data_batch))
+        if workers == 1 or len(data_batch) < 2 or total_length < self.CPU_PARALLEL_MIN_LENGTH * len(data_batch):
+            return [hashlib.sha256(data).digest() for data in data_batch]
+
+        if self._cpu_pool is None:
+            self._cpu_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sha256")
+        step = -(-len(data_batch) // workers)
+        chunks = [data_batch[i:i + step] for i in range(0, len(data_batch), step)]
+        digests = []
+        for part in self._cpu_pool.map(lambda chunk: [hashlib.sha256(data).digest() for data in chunk], chunks):
+            digests.extend(part)
+        return digests
+
     @classmethod
     def is_accelerator_available(cls) -> bool:
         """Check if hardware acceleration (NPU/GPU) is available."""
@@ -1,22 +1,27 @@
-import subprocess
 import tkinter as tk
 from tkinter import ttk, messagebox
 import psutil
-import sys
-import os
 import logging
-import uuid
+import operator
+import queue
+import threading
+import time
+from itertools import count
 from typing import Dict, List, Optional
-from datetime import datetime
 from wallet_scanner import WalletScanner
 from process_manager import ProcessPool
 
 
 class InstanceController:
     def __init__(self):
-        self.instances: Dict[str, subprocess.Popen] = {}
+        # Instances run as in-process scanners; each builds its own hasher
+        # only if GPU acceleration is turned on through set_acceleration_preferences
+        self.instances: Dict[str, WalletScanner] = {}
         self.max_instances = 4
-        self.wallet_scanner = WalletScanner()
+        self._process = psutil.Process()
+        self._process.cpu_percent()  # First call only sets the baseline and returns 0.0
+        self._usage_sample = (0.0, 0.0, 0.0)  # (time, cpu_percent, memory_percent)
+        self._instance_ids = count(1)
 
     def start_instance(self) -> bool:
         """Start a new wallet scanner instance."""
@@ -24,17 +29,14 @@ class InstanceController:
             return False
 
         try:
-            instance_id = f"instance_{len(self.instances) + 1}"
+            # A counter rather than the instance count, which repeats IDs of
+            # still-running instances once an earlier one has been stopped
+            instance_id = f"instance_{next(self._instance_ids)}"
 
-            process = subprocess.Popen(
-                [sys.executable, "main.py", "--instance-id", instance_id],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
-            )
+            scanner = WalletScanner()
+            scanner.start_scan()
 
-            self.instances[instance_id] = process
+            self.instances[instance_id] = scanner
             logging.info(f"Started new instance: {instance_id}")
             return True
 
@@ -53,19 +55,11 @@ class InstanceController:
             return False
 
         try:
-            process = self.instances[instance_id]
-            if os.name == 'nt':
-                subprocess.call(['taskkill', '/F', '/T', '/PID', str(process.pid)])
-            else:
-                process.terminate()
-            process.wait(timeout=5)
+            self.instances[instance_id].stop_scan()
             del self.instances[instance_id]
             logging.info(f"Successfully stopped instance: {instance_id}")
             return True
 
-        except subprocess.TimeoutExpired:
-            logging.error(f"Timeout while stopping instance {instance_id}")
-            return False
         except Exception as e:
             logging.error(f"Failed to stop instance {instance_id}: {str(e)}")
             return False
@@ -78,46 +72,93 @@ class InstanceController:
     def get_instance_count(self) -> int:
         return len(self.instances)
 
+    def _sample_usage(self):
+        """Sample the shared process's CPU/memory usage at most once per second."""
+        sampled_at, cpu_percent, memory_percent = self._usage_sample
+        now = time.monotonic()
+        if now - sampled_at >= 1.0:
+            try:
+                # as_dict() fetches both under a single oneshot() pass
+                usage = self._process.as_dict(attrs=['cpu_percent', 'memory_percent'])
+                cpu_percent = usage['cpu_percent']
+                memory_percent = usage['memory_percent']
+            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                logging.debug(f"Could not sample process usage: {str(e)}")
+            self._usage_sample = (now, cpu_percent, memory_percent)
+        return cpu_percent, memory_percent
+
     def get_instances_info(self) -> List[Dict]:
+        """Per-instance counters plus the usage of the one process they all share."""
         info = []
-        for instance_id, process in self.instances.items():
-            if process.poll() is None:  # Check if process is still running
-                try:
-                    proc = psutil.Process(process.pid)
-                    stats = self.wallet_scanner.get_statistics()
-                    info.append({
-                        'id': instance_id,
-                        'pid': process.pid,
-                        'cpu_percent': proc.cpu_percent(),
-                        'memory_percent': proc.memory_percent(),
-                        'status': 'Running',
-                        'scan_rate': f"{stats.get('cpu_scan_rate', 0) + stats.get('gpu_scan_rate', 0):.1f}/min",
-                        'wallets_scanned': stats.get('total_scanned', 0),
-                        'wallets_with_balance': stats.get('wallets_with_balance', 0)
-                    })
-                except:
-                    info.append({
-                        'id': instance_id,
-                        'pid': process.pid,
-                        'status': 'Unknown'
-                    })
+        cpu_percent, memory_percent = self._sample_usage()
+
+        for instance_id, scanner in self.instances.items():
+            try:
+                # Read the counters directly; get_statistics() also builds
+                # node fields not shown here. PID and usage are process-wide,
+                # identical on every row, and named so
+                info.append({
+                    'id': instance_id,
+                    'process_pid': self._process.pid,
+                    'process_cpu_percent': cpu_percent,
+                    'process_memory_percent': memory_percent,
+                    'status': 'Running' if scanner.scanning else 'Starting',
+                    'scan_rate': f"{scanner.cpu_rate_per_min + scanner.gpu_rate_per_min:.1f}/min",
+                    'wallets_scanned': f"{scanner.shared_total.value:,}",
+                    'wallets_with_balance': f"{scanner.shared_balance_count.value:,}"
+                })
+            except Exception as e:
+                logging.debug(f"Could not read stats for {instance_id}: {str(e)}")
+                info.append({
+                    'id': instance_id,
+                    'process_pid': self._process.pid,
+                    'status': 'Unknown'
+                })
         return info
 
 
-
-import tkinter as tk
-from tkinter import ttk, messagebox
-import logging
-import uuid
-from typing import Dict
-from datetime import datetime
-from process_manager import ProcessPool
-
 class ProcessManagerFrame(ttk.Frame):
+    # (column ID, heading, width) for the process list, in display order
+    COLUMNS = (
+        ("ID", "Process ID", 100),
+        ("Status", "Status", 80),
+        ("Time", "Running Time", 120),
+        ("Rate", "Scan Rate", 100),
+        ("Scanned", "Total Scanned", 100),
+        ("Found", "Wallets Found", 100),
+        ("Action", "Action", 80)
+    )
+
+    # Stats shown between the ID and Action columns, with defaults for keys a
+    # process hasn't reported
+    _ROW_DEFAULTS = {'status': 'N/A', 'start_time': '', 'scan_rate': 0, 'total_scanned': 'N/A', 'wallets_found': 'N/A'}
+    _ROW_FIELDS = operator.itemgetter('status', 'start_time', 'scan_rate', 'total_scanned', 'wallets_found')
+
+    # List refresh interval while processes are running and the tab is shown,
+    # and the slower one used otherwise. The sampler posts a snapshot once a
+    # second, so refreshing faster than that finds nothing new
+    REFRESH_MS = 1000
+    IDLE_REFRESH_MS = 5000
+    # Largest share of the Tk thread the refresh may take; a slower tick
+    # stretches the interval to match
+    REFRESH_BUDGET = 0.05
+
     def __init__(self, parent, main_app):
         super().__init__(parent)
         self.main_app = main_app
         self.process_pool = ProcessPool(max_processes=4)
+        # Rows use the process ID as their item ID; this maps each shown
+        # process to the values last written to its row
+        self._row_values: Dict[str, tuple] = {}
+
+        # Stats are sampled on a background thread; the UI only picks up the latest snapshot
+        self._snapshots = queue.Queue(maxsize=1)
+        self._sampler_stop = threading.Event()
+        threading.Thread(target=self._sampler_loop, daemon=True).start()
+        self._refresh_job = None
+        self._process_ids = count(1)
+        self._stopping = set()  # Process IDs with a stop in progress
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -159,26 +200,18 @@ class ProcessManagerFrame(ttk.Frame):
         # Process list
         self.tree = ttk.Treeview(
             self,
-            columns=("ID", "Status", "Time", "Rate", "Scanned", "Found", "Action"),
+            columns=tuple(col for col, _, _ in self.COLUMNS),
             show="headings",
             height=6
         )
 
-        # Configure columns
-        columns = [
-            ("ID", "Process ID", 100),
-            ("Status", "Status", 80),
-            ("Time", "Running Time", 120),
-            ("Rate", "Scan Rate", 100),
-            ("Scanned", "Total Scanned", 100),
-            ("Found", "Wallets Found", 100),
-            ("Action", "Action", 80)
-        ]
-
-        for col, heading, width in columns:
+        for col, heading, width in self.COLUMNS:
             self.tree.heading(col, text=heading)
             self.tree.column(col, width=width)
 
+        # Display column ID ("#N") of the trailing Action column, for click handling
+        self._action_column = f"#{len(self.COLUMNS)}"
+
         self.tree.grid(row=2, column=0, pady=10, padx=10, sticky="nsew")
 
         # Add scrollbar
@@ -198,13 +231,20 @@ class ProcessManagerFrame(ttk.Frame):
         # Bind click event for stop buttons
         self.tree.bind('<ButtonRelease-1>', self.handle_click)
 
+        # Refresh right away when the tab is shown again after idling, or
+        # the window is restored; <Map> on the frame alone misses de-iconify
+        self.bind('<Map>', lambda e: self._schedule_refresh(0))
+        toplevel = self.winfo_toplevel()
+        toplevel.bind('<Map>', self._on_toplevel_map, add='+')
+        toplevel.bind('<Unmap>', self._on_toplevel_map, add='+')
+
         # Start auto-refresh
         self.update_process_list()
 
     def start_process(self):
         """Start a new wallet scanner process in a new tab."""
         try:
-            process_id = str(uuid.uuid4())[:8]
+            process_id = f"proc_{next(self._process_ids):04d}"
 
             # Start the process
             if self.process_pool.start_process(process_id):
@@ -213,6 +253,7 @@ class ProcessManagerFrame(ttk.Frame):
                 if process_frame:
                     self.status_var.set(f"Started new process {process_id}")
                     logging.info(f"Started new process: {process_id}")
+                self._schedule_refresh(self.REFRESH_MS)
             else:
                 messagebox.showwarning(
                     "Process Limit",
@@ -224,19 +265,46 @@ class ProcessManagerFrame(ttk.Frame):
             logging.error(error_message)
             messagebox.showerror("Error", error_message)
 
-    def stop_process(self, process_id: str) -> bool:
-        """Stop a specific process by ID."""
-        if self.process_pool.stop_process(process_id):
+    def stop_process(self, process_id: str):
+        """Stop a specific process by ID in the background, reporting back when done."""
+        if process_id in self._stopping:
+            return
+        self._stopping.add(process_id)
+        self.status_var.set(f"Stopping process {process_id}...")
+
+        # join() can take seconds, so it must not run on the Tk thread
+        def stop():
+            stopped = self.process_pool.stop_process(process_id)
+            self.after(0, lambda: self._finish_stop(process_id, stopped))
+
+        threading.Thread(target=stop, daemon=True).start()
+
+    def _finish_stop(self, process_id: str, stopped: bool):
+        """Report the outcome of stop_process on the Tk thread."""
+        self._stopping.discard(process_id)
+        if stopped:
             self.main_app.remove_process_tab(process_id)
             logging.info(f"Successfully stopped process: {process_id}")
-            return True
-        return False
+            self.status_var.set(f"Successfully stopped process {process_id}")
+        else:
+            self.status_var.set(f"Failed to stop process {process_id}")
 
     def stop_all_processes(self):
-        """Stop all running processes."""
-        for process_id in list(self.process_pool.processes.keys()):
-            self.stop_process(process_id)
-        self.status_var.set(f"Stopped all processes ({datetime.now().strftime('%H:%M:%S')})")
+        """Stop all running processes without blocking the UI."""
+        self.status_var.set("Stopping all processes...")
+
+        def stop_all():
+            stopped = self.process_pool.stop_all()
+            self.after(0, lambda: self._finish_stop_all(stopped))
+
+        threading.Thread(target=stop_all, daemon=True).start()
+
+    def _finish_stop_all(self, stopped: List[str]):
+        """Remove the tabs of processes stopped by stop_all_processes."""
+        for process_id in stopped:
+            self.main_app.remove_process_tab(process_id)
+            logging.info(f"Successfully stopped process: {process_id}")
+        self.status_var.set(f"Stopped all processes ({time.strftime('%H:%M:%S')})")
 
     def handle_click(self, event):
         """Handle click events on the treeview."""
@@ -244,45 +312,102 @@ class ProcessManagerFrame(ttk.Frame):
             region = self.tree.identify("region", event.x, event.y)
             if region == "cell":
                 column = self.tree.identify_column(event.x)
-                item = self.tree.identify_row(event.y)
-                if column == "#7":  # Action column
-                    process_id = self.tree.item(item)['values'][0]
+                if column == self._action_column:
+                    # Item IDs are process IDs, so no need to read back the
+                    # row values (which Tk would turn into ints for numeric IDs)
+                    process_id = self.tree.identify_row(event.y)
                     if process_id:
-                        if self.stop_process(process_id):
-                            self.status_var.set(f"Successfully stopped process {process_id}")
-                        else:
-                            self.status_var.set(f"Failed to stop process {process_id}")
+                        self.stop_process(process_id)
         except Exception as e:
             logging.error(f"Error handling process stop click: {str(e)}")
             self.status_var.set("Error stopping process. Check logs for details.")
 
-    def update_process_list(self):
-        """Update the process list display."""
-        try:
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Add current processes
-            for process_id in self.process_pool.processes:
+    def _sampler_loop(self):
+        """Collect process stats off the Tk thread, keeping only the latest snapshot."""
+        while True:
+            snapshot = {}
+            for process_id in list(self.process_pool.processes):
                 stats = self.process_pool.get_process_stats(process_id)
                 if stats:
-                    self.tree.insert(
-                        "",
-                        tk.END,
-                        values=(
-                            process_id,
-                            stats['status'],
-                            stats['start_time'],
-                            f"{float(stats.get('scan_rate', 0)):.1f}/min",
-                            stats.get('total_scanned', 'N/A'),
-                            stats.get('wallets_found', 'N/A'),
-                            "Stop"
-                        )
-                    )
+                    snapshot[process_id] = self._format_row(process_id, stats)
+
+            # Replace any snapshot the UI hasn't picked up yet
+            try:
+                self._snapshots.get_nowait()
+            except queue.Empty:
+                pass
+            self._snapshots.put_nowait(snapshot)
+
+            if self._sampler_stop.wait(1.0):
+                break
+
+    @classmethod
+    def _format_row(cls, process_id: str, stats: Dict) -> tuple:
+        """Build the Treeview values for a process from its stats."""
+        status, start_time, scan_rate, scanned, found = cls._ROW_FIELDS({**cls._ROW_DEFAULTS, **stats})
+        if isinstance(scanned, int):
+            scanned = f"{scanned:,}"
+        return (process_id, status, start_time, f"{float(scan_rate):.1f}/min", scanned, found, "Stop")
+
+    def destroy(self):
+        """Stop the stats sampler along with the frame."""
+        self._sampler_stop.set()
+        super().destroy()
+
+    def update_process_list(self):
+        """Update the process list display, touching only rows and cells that changed."""
+        started = time.perf_counter()
+        try:
+            current = self.process_pool.processes
+
+            # Drop rows for processes that have gone away
+            for process_id in list(self._row_values):
+                if process_id not in current:
+                    self.tree.delete(process_id)
+                    del self._row_values[process_id]
+
+            try:
+                snapshot = self._snapshots.get_nowait()
+            except queue.Empty:
+                snapshot = {}
+
+            # Rows arrive already formatted by the sampler thread
+            for process_id, values in snapshot.items():
+                # Skip processes stopped since the snapshot was taken
+                if process_id not in current:
+                    continue
+
+                # Compare against what was last written rather than asking Tk,
+                # so unchanged rows cost no Tcl calls at all
+                previous = self._row_values.get(process_id)
+                if previous == values:
+                    continue
+                self._row_values[process_id] = values
+
+                if previous is None:
+                    self.tree.insert("", tk.END, iid=process_id, values=values)
+                else:
+                    self.tree.item(process_id, values=values)
 
         except Exception as e:
             logging.error(f"Error updating process list: {str(e)}")
 
-        # Schedule next update
-        self.after(1000, self.update_process_list)
\ No newline at end of file
+        # Stats are collected by the sampler thread, so this tick is widget
+        # work only; back off while nothing runs or the tab isn't visible
+        busy = self.process_pool.processes and self.winfo_viewable()
+        cost_ms = (time.perf_counter() - started) * 1000
+        self._schedule_refresh(max(self.REFRESH_MS if busy else self.IDLE_REFRESH_MS,
+                                   round(cost_ms / self.REFRESH_BUDGET)))
+
+    def _on_toplevel_map(self, event):
+        """Refresh when the window is restored, and drop to the idle cadence when it is minimized."""
+        # Toplevel bindings also see the events of every child widget
+        if not self.winfo_exists() or str(event.widget) != str(self.winfo_toplevel()):
+            return
+        self._schedule_refresh(0 if event.type == tk.EventType.Map else self.IDLE_REFRESH_MS)
+
+    def _schedule_refresh(self, delay_ms: int):
+        """(Re)schedule the next list refresh, replacing any pending one."""
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(delay_ms, self.update_process_list)
@@ -1,38 +1,148 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import logging
+import operator
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import os
+import queue
 import threading
-from datetime import datetime
-from wallet_scanner import WalletScanner
-from typing import Dict
-from bitcoin_utils import BitcoinUtils
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from bitcoin_utils import BitcoinUtils, LOG_LEVEL
 import json
 import socket
 import time
-
-# Configure logging
+from itertools import count
+
+# Configure logging: callers only enqueue records, and a listener thread
+# formats and writes them so scanner and UI threads never wait on disk I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - [%(threadName)s] %(message)s')
+_log_handlers = [logging.StreamHandler(), logging.FileHandler('bitcoin_wallet.log', delay=True)]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue only carries the merged message; the listener's handlers add the
+# rest. force: bitcoin_utils already configured the root logger on import.
+# LOG_LEVEL=DEBUG brings back the per-poll connection and stats tracing
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - [%(threadName)s] %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('bitcoin_wallet.log')
-    ]
+    level=LOG_LEVEL,
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)],
+    force=True
 )
 
+
+def _log_directly():
+    """Forked children have no listener thread, so they write straight to the handlers."""
+    logging.getLogger().handlers = list(_log_handlers)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_log_directly)
+
+@dataclass
+class NodeStatus:
+    """Outcome of one node poll."""
+    connected: bool
+    node_info: Optional[Dict] = None
+    error: Optional[str] = None
+
+
+class NodeStatusBroker:
+    """Polls the node from one background thread and hands each status to subscribers on the Tk thread."""
+    POLL_INTERVAL = 5.0
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self.latest: Optional[NodeStatus] = None
+        self.subscribers: List[Callable[[NodeStatus], None]] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="NodeStatusBroker", daemon=True)
+
+    def subscribe(self, callback: Callable[[NodeStatus], None]):
+        """Register a Tk-thread callback for every status, starting with the latest one."""
+        self.subscribers.append(callback)
+        if self.latest is not None:
+            self.root.after(0, callback, self.latest)
+
+    def unsubscribe(self, callback: Callable[[NodeStatus], None]):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                status = NodeStatus(connected=True, node_info=BitcoinUtils.get_node_info())
+            except Exception as e:
+                status = NodeStatus(connected=False, error=str(e))
+                logging.error(f"Node connection error: {str(e)}")
+
+            self.latest = status
+            try:
+                self.root.after(0, self._publish, status)
+            except RuntimeError as e:
+                if self._stop.is_set():
+                    break  # Tk has shut down
+                # Tk refuses after() from other threads until mainloop runs;
+                # the next poll delivers again
+                logging.warning(f"Could not deliver node status: {str(e)}")
+            self._stop.wait(self.POLL_INTERVAL)
+
+    def _publish(self, status: NodeStatus):
+        for callback in list(self.subscribers):
+            try:
+                callback(status)
+            except Exception as e:
+                logging.error(f"Error delivering node status: {str(e)}")
+
+
 # NodeSettingsFrame class update
 class NodeSettingsFrame(ttk.Frame):
-    def __init__(self, parent):
+    INFO_TEMPLATE = (
+        "Connected to Bitcoin Node\n"
+        "Network: {chain}\n"
+        "Block Height: {blocks:,}\n"
+        "Connected Peers: {peers}\n"
+        "Sync Progress: {progress}"
+    )
+    FAILURE_TEMPLATE = (
+        "Bitcoin Node Connection Failed\n"
+        "Error: {error}\n\n"
+        "Please check:\n"
+        "1. Bitcoin Core is running\n"
+        "2. RPC settings are correct\n"
+        "3. Network connectivity"
+    )
+    # Result polling for a connection test backs off between these delays (ms)
+    STATUS_POLL_MIN_MS = 50
+    STATUS_POLL_MAX_MS = 1000
+
+    def __init__(self, parent, node_status: NodeStatusBroker):
         logging.debug("Initializing NodeSettingsFrame")
         super().__init__(parent)
         self.bitcoin_utils = BitcoinUtils()
-        self._connection_check_after = None
+        self.node_status = node_status
         self._check_pending = False
-        self._last_check_time = 0
-        self._check_interval = 5000  # 5 seconds between checks
+        self._last_check_ns = 0
+        self._check_interval_ns = 5_000_000_000  # 5 seconds between checks
+        self._status_delay = self.STATUS_POLL_MIN_MS
+        # Runs connection tests and the node info fetch that follows a success
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NodeConnectionTest")
         self.setup_ui()
-        self.start_connection_check()
+        self.node_status.subscribe(self._on_node_status)
         logging.debug("NodeSettingsFrame initialization complete")
 
     def setup_ui(self):
@@ -77,6 +187,13 @@ class NodeSettingsFrame(ttk.Frame):
         self.port_var = tk.StringVar(value=self.bitcoin_utils.NODE_PORT)
         ttk.Entry(port_frame, textvariable=self.port_var).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
 
+        # RPC connection pool size
+        pool_frame = ttk.Frame(settings_container)
+        pool_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(pool_frame, text="RPC Connections:").pack(side=tk.LEFT, padx=5)
+        self.pool_size_var = tk.StringVar(value=str(self.bitcoin_utils.RPC_POOL_SIZE))
+        ttk.Spinbox(pool_frame, from_=1, to=16, textvariable=self.pool_size_var, width=5).pack(side=tk.LEFT, padx=5)
+
         # RPC Username
         user_frame = ttk.Frame(settings_container)
         user_frame.pack(fill=tk.X, pady=2)
@@ -115,11 +232,18 @@ class NodeSettingsFrame(ttk.Frame):
         ).pack(side=tk.LEFT, padx=5)
 
         # Node info display
-        self.info_text = tk.Text(settings_frame, height=10, width=50)
-        self.info_text.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
+        # A label rather than a Text: the status is short, read-only and
+        # replaced wholesale, so the Text index and tag machinery isn't needed
+        self.info_var = tk.StringVar()
+        ttk.Label(
+            settings_frame,
+            textvariable=self.info_var,
+            justify=tk.LEFT,
+            anchor="nw",
+            width=50
+        ).pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
 
     def browse_wallet_dir(self):
-        from tkinter import filedialog
         directory = filedialog.askdirectory(initialdir=self.wallet_dir_var.get())
         if directory:
             self.wallet_dir_var.set(directory)
@@ -127,35 +251,47 @@ class NodeSettingsFrame(ttk.Frame):
     def save_settings(self):
         try:
             # Update Bitcoin Utils settings
+            pool_size = int(self.pool_size_var.get())
             self.bitcoin_utils.configure_node(
                 self.url_var.get(),
                 self.port_var.get(),
                 self.user_var.get(),
-                self.pass_var.get()
+                self.pass_var.get(),
+                pool_size=pool_size
             )
-
-            # Save wallet directory and all settings
-            wallet_dir = self.wallet_dir_var.get()
-            os.makedirs(wallet_dir, exist_ok=True)
-
-            # Save to config file
-            self.bitcoin_utils.save_config(
+            settings = dict(
                 url=self.url_var.get(),
                 port=self.port_var.get(),
                 username=self.user_var.get(),
                 password=self.pass_var.get(),
-                wallet_dir=wallet_dir
+                wallet_dir=self.wallet_dir_var.get(),
+                pool_size=pool_size
             )
-
-            messagebox.showinfo("Success", "Settings saved successfully")
-            self.check_connection()
-
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
+            return
+
+        def save():
+            # Disk writes run here so a slow drive can't freeze the window
+            try:
+                # Save wallet directory and all settings
+                os.makedirs(settings['wallet_dir'], exist_ok=True)
+
+                # Save to config file
+                self.bitcoin_utils.save_config(**settings)
+                self.after(0, self._settings_saved)
+            except Exception as e:
+                self.after(0, messagebox.showerror, "Error", f"Failed to save settings: {str(e)}")
+
+        threading.Thread(target=save, name="SaveSettings", daemon=True).start()
+
+    def _settings_saved(self):
+        messagebox.showinfo("Success", "Settings saved successfully")
+        self.check_connection()
 
     def check_connection(self):
         """Test connection to Bitcoin node with improved async handling."""
-        current_time = time.time() * 1000  # Convert to milliseconds
+        now = time.monotonic_ns()  # Unaffected by wall-clock changes
 
         # Prevent multiple simultaneous checks
         if self._check_pending:
@@ -163,45 +299,33 @@ class NodeSettingsFrame(ttk.Frame):
             return
 
         # Enforce minimum interval between checks
-        if current_time - self._last_check_time < self._check_interval:
+        if now - self._last_check_ns < self._check_interval_ns:
             logging.debug("Skipping connection check - too soon")
             return
 
         logging.debug("Starting node connection check")
         self._check_pending = True
-        self._last_check_time = current_time
+        self._last_check_ns = now
         self.status_label.config(text="Checking connection...", foreground="gray")
         self.status_indicator.config(foreground="gray")
 
-        def async_check():
-            try:
-                success = BitcoinUtils.test_connection_async()
-                if success:
-                    # Schedule first status check with increased delay
-                    self.after(1000, self._check_connection_status)
-                else:
-                    self._handle_connection_failure("Failed to initiate connection test")
-            except Exception as e:
-                self._handle_connection_failure(str(e))
-
-        # Run check in separate thread
-        self.after(0, async_check)
+        # Look early: a healthy node answers well within a second
+        future = self._executor.submit(BitcoinUtils.test_connection)
+        self._status_delay = self.STATUS_POLL_MIN_MS
+        self.after(self._status_delay, self._check_connection_status, future)
         logging.debug("Async connection check initiated")
 
-    def _check_connection_status(self):
-        """Check the result of async connection test with improved error handling."""
-        if not hasattr(self, 'status_label'):  # Check if widget still exists
-            return
-
+    def _check_connection_status(self, future: Future):
+        """Check the result of the connection test with improved error handling."""
         try:
-            status, error = BitcoinUtils.get_connection_status()
-
-            if status is None:
-                # Still waiting for result, check again in 1 second
+            if not future.done():
+                # Still waiting for result, check again after a doubled delay
                 if self._check_pending:  # Only reschedule if still pending
-                    self.after(1000, self._check_connection_status)
+                    self._status_delay = min(self.STATUS_POLL_MAX_MS, self._status_delay * 2)
+                    self.after(self._status_delay, self._check_connection_status, future)
                 return
 
+            status, error = future.result()
             if status:
                 self._handle_connection_success()
             else:
@@ -211,46 +335,34 @@ class NodeSettingsFrame(ttk.Frame):
             self._handle_connection_failure(f"Error checking connection: {str(e)}")
 
     def _handle_connection_success(self):
-        """Handle successful connection with error catching."""
-        try:
-            # Add timeout for node info retrieval
-            timeout = 5  # 5 seconds timeout
-            start_time = time.time()
-
-            def update_ui():
-                if time.time() - start_time > timeout:
-                    raise TimeoutError("Node info retrieval timed out")
-
+        """Fetch node details on a worker thread, then show them on the Tk thread."""
+        def fetch():
+            # The RPC socket timeout bounds how long this can take
+            try:
                 node_info = self.bitcoin_utils.get_node_info()
                 logging.debug("Retrieved node info for UI update")
+                self.after(0, self._finish_connection_check, node_info)
+            except TimeoutError as e:
+                self.after(0, self._handle_connection_failure, f"Operation timed out: {str(e)}")
+            except Exception as e:
+                self.after(0, self._handle_connection_failure, f"Error getting node info: {str(e)}")
 
-                self.status_indicator.config(foreground="green")
-                self.status_label.config(text="Connected", foreground="green")
-                logging.debug("Updated status indicators")
+        self._executor.submit(fetch)
 
-                status_text = (
-                    f"Connected to Bitcoin Node\n"
-                    f"Network: {node_info['chain']}\n"
-                    f"Block Height: {node_info['blocks']:,}\n"
-                    f"Connected Peers: {node_info['peers']}\n"
-                    f"Sync Progress: {node_info.get('progress', 'N/A')}" #Handle missing key
-                )
+    def _finish_connection_check(self, node_info: Dict):
+        self._check_pending = False
+        self._show_node_info(node_info)
+        logging.debug("Connection check completed")
 
-                self.info_text.delete(1.0, tk.END)
-                self.info_text.insert(tk.END, status_text)
-                logging.debug("Updated info text")
+    def _show_node_info(self, node_info: Dict):
+        """Show a connected status and the node's details."""
+        self.status_indicator.config(foreground="green")
+        self.status_label.config(text="Connected", foreground="green")
+        logging.debug("Updated status indicators")
 
-            # Schedule UI update on main thread
-            self.after(0, update_ui)
-            logging.debug("Scheduled UI update")
+        status_text = self.INFO_TEMPLATE.format_map({'progress': 'N/A', **node_info})  # Handle missing key
 
-        except TimeoutError as e:
-            self._handle_connection_failure(f"Operation timed out: {str(e)}")
-        except Exception as e:
-            self._handle_connection_failure(f"Error getting node info: {str(e)}")
-        finally:
-            self._check_pending = False
-            logging.debug("Connection check completed")
+        self._set_info_text(status_text)
 
     def _handle_connection_failure(self, error_msg: str):
         """Handle connection failure with cleanup."""
@@ -258,45 +370,68 @@ class NodeSettingsFrame(ttk.Frame):
         self.status_indicator.config(foreground="red")
         self.status_label.config(text="Not Connected", foreground="red")
 
-        status_text = (
-            f"Bitcoin Node Connection Failed\n"
-            f"Error: {error_msg}\n\n"
-            f"Please check:\n"
-            f"1. Bitcoin Core is running\n"
-            f"2. RPC settings are correct\n"
-            f"3. Network connectivity"
-        )
+        status_text = self.FAILURE_TEMPLATE.format(error=error_msg)
 
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, status_text)
+        self._set_info_text(status_text)
         self._check_pending = False
 
-    def start_connection_check(self):
-        """Start periodic connection checks with improved scheduling."""
-        def schedule_check():
-            if hasattr(self, 'status_label'):
-                self.check_connection()
-                # Schedule next check using class interval
-                self._connection_check_after = self.after(
-                    self._check_interval,
-                    schedule_check
-                )
+    def _set_info_text(self, status_text: str):
+        """Replace the node info text, skipping the redraw when it is unchanged."""
+        # Status polls mostly repeat the previous text
+        if status_text != self.info_var.get():
+            self.info_var.set(status_text)
 
-        # Start first check
-        schedule_check()
+    def _on_node_status(self, status: NodeStatus):
+        """Show the broker's latest poll, unless a manual test is in progress."""
+        if self._check_pending:
+            return
+        if status.connected:
+            self._show_node_info(status.node_info)
+        else:
+            self._handle_connection_failure(status.error)
 
     def on_destroy(self):
         """Clean up scheduled tasks and pending operations."""
-        if self._connection_check_after:
-            self.after_cancel(self._connection_check_after)
+        self.node_status.unsubscribe(self._on_node_status)
+        self._executor.shutdown(wait=False)
         self._check_pending = False  # Ensure no pending checks remain
 
 
-class SummaryTab(ttk.Frame):
+class StatsTab(ttk.Frame):
+    """A notebook page whose stats_text widget shows STATS_TEMPLATE filled from a stats snapshot."""
+    STATS_TEMPLATE = ""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self._last_stats = None  # Stats last rendered, to skip no-op redraws
+
+    def render_stats(self, stats, updated: str):
+        """Show a statistics snapshot; called from the app's update tick."""
+        # Leave the widget alone while the numbers are unchanged
+        if stats and stats != self._last_stats:
+            self._last_stats = dict(stats)
+            stats_text = self.STATS_TEMPLATE.format_map({**stats, 'updated': updated})
+            self.stats_text.replace("1.0", tk.END, stats_text)
+
+
+class SummaryTab(StatsTab):
+    STATS_TEMPLATE = (
+        "=== Combined Statistics ===\n"
+        "Active Scanners: {active_scanners}\n"
+        "Total Scanned: {total_scanned:,}\n"
+        "Total CPU Processed: {cpu_processed:,}\n"
+        "Total GPU Processed: {gpu_processed:,}\n"
+        "Total Found Wallets: {wallets_with_balance:,}\n"
+        "Combined CPU Rate: {cpu_scan_rate:.1f}/min\n"
+        "Combined GPU Rate: {gpu_scan_rate:.1f}/min\n"
+        "Total Queue Size: {queue_size:,}\n"
+        "Last Updated: {updated}\n"
+        "========================="
+    )
+
     def __init__(self, parent):
         super().__init__(parent)
         self.setup_ui()
-        self.start_update_thread()
 
     def setup_ui(self):
         # Configure grid
@@ -306,47 +441,32 @@ class SummaryTab(ttk.Frame):
         status_frame = ttk.LabelFrame(self, text="Overall Statistics")
         status_frame.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
 
-        self.stats_text = tk.Text(status_frame, height=12, width=50)
+        self.stats_text = tk.Text(status_frame, height=12, width=50, undo=False, autoseparators=False)
         self.stats_text.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
 
-    def start_update_thread(self):
-        self.update_thread = threading.Thread(target=self.update_stats, daemon=True)
-        self.update_thread.start()
-
-    def update_stats(self):
-        while True:
-            try:
-                if hasattr(self, 'stats_text') and hasattr(self, 'get_combined_stats'):
-                    stats = self.get_combined_stats()
-                    if stats:
-                        stats_text = (
-                            f"=== Combined Statistics ===\n"
-                            f"Active Scanners: {stats['active_scanners']}\n"
-                            f"Total Scanned: {stats['total_scanned']}\n"
-                            f"Total CPU Processed: {stats['cpu_processed']}\n"
-                            f"Total GPU Processed: {stats['gpu_processed']}\n"
-                            f"Total Found Wallets: {stats['wallets_with_balance']}\n"
-                            f"Combined CPU Rate: {stats['cpu_scan_rate']}/min\n"
-                            f"Combined GPU Rate: {stats['gpu_scan_rate']}/min\n"
-                            f"Total Queue Size: {stats['queue_size']}\n"
-                            f"Last Updated: {datetime.now().strftime('%H:%M:%S')}\n"
-                            f"========================="
-                        )
-                        self.stats_text.delete(1.0, tk.END)
-                        self.stats_text.insert(tk.END, stats_text)
-            except Exception as e:
-                logging.error(f"Error updating summary stats: {str(e)}")
-            finally:
-                threading.Event().wait(1.0)
 
+class WalletScannerTab(StatsTab):
+    STATS_TEMPLATE = (
+        "=== Node Connection Status ===\n"
+        "Network: {node_chain}\n"
+        "Block Height: {node_height:,}\n"
+        "\n=== Scan Statistics ===\n"
+        "Total Scanned: {total_scanned:,}\n"
+        "CPU Processed: {cpu_processed:,}\n"
+        "GPU Processed: {gpu_processed:,}\n"
+        "Found Wallets: {wallets_with_balance:,}\n"
+        "CPU Scan Rate: {cpu_scan_rate:,.1f}/min\n"
+        "GPU Scan Rate: {gpu_scan_rate:,.1f}/min\n"
+        "Queue Size: {queue_size:,}\n"
+        "Last Updated: {updated}"
+    )
 
-class WalletScannerTab(ttk.Frame):
     def __init__(self, parent, tab_id: str):
         super().__init__(parent)
         self.tab_id = tab_id
+        # Imported here so pyopencl/numpy load with the first scanner, not at startup
+        from wallet_scanner import WalletScanner
         self.scanner = WalletScanner()
-        self._stats_update_after_id = None
-        self._is_updating = False
         self.setup_ui()
 
     def setup_ui(self):
@@ -387,52 +507,9 @@ class WalletScannerTab(ttk.Frame):
         stats_frame = ttk.LabelFrame(self, text="Statistics")
         stats_frame.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
 
-        self.stats_text = tk.Text(stats_frame, height=10, width=50)
+        self.stats_text = tk.Text(stats_frame, height=10, width=50, undo=False, autoseparators=False)
         self.stats_text.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
 
-        # Don't start the update thread immediately
-        self.schedule_stats_update()
-
-    def schedule_stats_update(self):
-        """Schedule the next statistics update using tkinter's after()"""
-        if not self._is_updating and hasattr(self, 'stats_text'):
-            self._is_updating = True
-            self.after(1000, self._update_stats)
-
-    def _update_stats(self):
-        """Update statistics in a non-blocking way"""
-        try:
-            if not hasattr(self, 'stats_text'):
-                return
-
-            stats = self.scanner.get_statistics()  # Now using cached stats
-            if stats:
-                stats_text = (
-                    f"=== Node Connection Status ===\n"
-                    f"Network: {stats['node_chain']}\n"
-                    f"Block Height: {stats['node_height']:,}\n"
-                    f"\n=== Scan Statistics ===\n"
-                    f"Total Scanned: {stats['total_scanned']}\n"
-                    f"CPU Processed: {stats['cpu_processed']}\n"
-                    f"GPU Processed: {stats['gpu_processed']}\n"
-                    f"Found Wallets: {stats['wallets_with_balance']}\n"
-                    f"CPU Scan Rate: {stats['cpu_scan_rate']}/min\n"
-                    f"GPU Scan Rate: {stats['gpu_scan_rate']}/min\n"
-                    f"Queue Size: {stats['queue_size']}\n"
-                    f"Last Updated: {datetime.now().strftime('%H:%M:%S')}"
-                )
-
-                self.stats_text.delete(1.0, tk.END)
-                self.stats_text.insert(tk.END, stats_text)
-
-        except Exception as e:
-            logging.error(f"Error updating stats in tab {self.tab_id}: {str(e)}")
-        finally:
-            self._is_updating = False
-            # Schedule next update if we're still visible
-            if self.winfo_viewable():
-                self.schedule_stats_update()
-
     def update_threads(self):
         """Update thread count with improved error handling"""
         try:
@@ -473,7 +550,6 @@ class WalletScannerTab(ttk.Frame):
             self.start_btn.config(text="■ Stop", state='normal')
             self.stop_btn.config(state='normal')
             self.thread_spinbox.config(state='disabled')
-            self.schedule_stats_update()
 
             logging.info(f"Scanner started in tab {self.tab_id}")
         except Exception as e:
@@ -491,64 +567,21 @@ class WalletScannerTab(ttk.Frame):
             self.stop_btn.config(state='disabled')
             self.thread_spinbox.config(state='normal')
 
-            # Cancel any pending stats updates
-            self._is_updating = False
-
             logging.info(f"Scanner stopped in tab {self.tab_id}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop scanner: {str(e)}")
             logging.error(f"Failed to stop scanner in tab {self.tab_id}: {str(e)}")
 
-    def get_statistics(self):
-        """Get current node information."""
-        try:
-            # Add timeout handling for node info collection
-            start_time = time.time()
-            timeout = 5  # 5 second timeout
-
-            # Verify live node connection with timeout
-            BitcoinUtils.verify_live_node()
-            logging.debug("Live node verification successful")
-
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Node info collection timed out")
-
-            node_info = BitcoinUtils.get_node_info()
-            logging.debug(f"Retrieved node info successfully: {node_info}")
-
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Node info collection timed out")
-
-            cpu_rate_per_min = self.scanner.cpu_scan_rate * 60
-            gpu_rate_per_min = self.scanner.gpu_scan_rate * 60
-            logging.debug("Calculated scan rates")
-
-            stats = {
-                'total_scanned': f"{self.scanner.shared_total.value:,}",
-                'cpu_processed': f"{self.scanner.cpu_processed.value:,}",
-                'gpu_processed': f"{self.scanner.gpu_processed.value:,}",
-                'wallets_with_balance': f"{self.scanner.shared_balance_count.value:,}",
-                'cpu_scan_rate': f"{cpu_rate_per_min:,.1f}",
-                'gpu_scan_rate': f"{gpu_rate_per_min:,.1f}",
-                'queue_size': f"{self.scanner.wallet_queue.qsize():,}",
-                'node_chain': node_info['chain'],
-                'node_height': node_info['blocks']
-            }
-            logging.debug("Statistics compilation complete")
-            return stats
-
-        except TimeoutError as e:
-            logging.error(f"Instance {self.tab_id}: Statistics collection timed out: {str(e)}")
-            self.stop_scanning()
-            raise
-        except Exception as e:
-            logging.error(f"Instance {self.tab_id}: Failed to get statistics - no live node connection: {str(e)}")
-            self.stop_scanning()  # Stop scanning if we lose node connection
-            raise
-
-
 
 class BitcoinEducationApp(tk.Tk):
+    # Seconds before a stats error that keeps recurring is logged again
+    ERROR_LOG_INTERVAL = 30.0
+    MAX_SCANNERS = 4
+    # Scanner statistics that add up across scanners for the summary tab
+    SUMMED_STATS = ('total_scanned', 'cpu_processed', 'gpu_processed', 'wallets_with_balance',
+                    'cpu_scan_rate', 'gpu_scan_rate', 'queue_size')
+    _SUMMED_FIELDS = operator.itemgetter(*SUMMED_STATS)
+
     def __init__(self):
         super().__init__()
 
@@ -574,23 +607,31 @@ class BitcoinEducationApp(tk.Tk):
 
         # Dictionary to store tabs
         self.tabs: Dict[str, WalletScannerTab] = {}
+        self._tab_ids: Dict[str, str] = {}  # Tab widget path -> tab ID
+        self._tab_numbers = count(1)
+        self._tick_errors: Dict[str, tuple] = {}  # source -> (last error logged, when)
+
+        # One poller shares node status with the status bar and Node Settings
+        self.node_status = NodeStatusBroker(self)
 
         # Create summary tab
         self.summary_tab = SummaryTab(self.notebook)
         self.notebook.add(self.summary_tab, text="Summary")
 
         # Create node settings tab
-        self.node_settings = NodeSettingsFrame(self.notebook)
+        self.node_settings = NodeSettingsFrame(self.notebook, self.node_status)
         self.notebook.add(self.node_settings, text="Node Settings")
 
-        # Add get_combined_stats method to summary tab
-        self.summary_tab.get_combined_stats = self.get_combined_stats
+        # Create initial scanner tab once the window is up, so the scanner
+        # imports and accelerator setup don't hold back the first draw
+        self.after(0, self.add_scanner_tab)
 
-        # Create initial scanner tab
-        self.add_scanner_tab()
+        self.node_status.subscribe(self._on_node_status)
+        # Polling starts with the mainloop, which is what the broker delivers through
+        self.after(0, self.node_status.start)
 
-        # Start connection check thread
-        self.start_connection_check()
+        # One timer refreshes every tab's statistics on the Tk thread
+        self.after(1000, self._tick)
 
     def setup_status_bar(self):
         status_frame = ttk.Frame(self.container)
@@ -610,25 +651,55 @@ class BitcoinEducationApp(tk.Tk):
         )
         self.connection_text.pack(side=tk.LEFT)
 
-    def start_connection_check(self):
-        def check_connection():
-            while True:
-                try:
-                    bitcoin_utils = BitcoinUtils()
-                    bitcoin_utils.verify_live_node()
-                    node_info = bitcoin_utils.get_node_info()
-
-                    self.connection_indicator.config(foreground="green")
-                    self.connection_text.config(text=f"Connected to node - Chain: {node_info['chain']}")
-                except Exception as e:
-                    self.connection_indicator.config(foreground="red")
-                    self.connection_text.config(text=f"Node Error: {str(e)}")
-                    logging.error(f"Node connection error: {str(e)}")
-                finally:
-                    threading.Event().wait(5.0)  # Check every 5 seconds
-
-        thread = threading.Thread(target=check_connection, daemon=True)
-        thread.start()
+    def _on_node_status(self, status: NodeStatus):
+        """Show the latest node poll in the status bar."""
+        if status.connected:
+            self.connection_indicator.config(foreground="green")
+            self.connection_text.config(text=f"Connected to node - Chain: {status.node_info['chain']}")
+        else:
+            self.connection_indicator.config(foreground="red")
+            self.connection_text.config(text=f"Node Error: {status.error}")
+
+    def _tick(self):
+        """Refresh the statistics of the scanner or summary tab currently on screen."""
+        # Only the notebook page on screen is drawn. Scanners are queried
+        # for their own visible tab, or for all of them under the summary
+        summary_visible = self.summary_tab.winfo_viewable()
+        visible_tabs = {
+            tab_id: tab for tab_id, tab in self.tabs.items()
+            if summary_visible or tab.winfo_viewable()
+        }
+        if not visible_tabs and not summary_visible:
+            self.after(1000, self._tick)
+            return
+
+        # Each scanner is queried once; the summary reuses the same snapshots.
+        # get_statistics only reads shared counters and the cached node info
+        updated = time.strftime('%H:%M:%S')
+        snapshots = {}
+        for tab_id, tab in visible_tabs.items():
+            try:
+                snapshots[tab_id] = tab.scanner.get_statistics()
+                if not summary_visible:
+                    tab.render_stats(snapshots[tab_id], updated)
+            except Exception as e:
+                self._log_tick_error(tab_id, f"Error updating stats in tab {tab.tab_id}: {str(e)}")
+
+        if summary_visible:
+            try:
+                self.summary_tab.render_stats(self.get_combined_stats(snapshots), updated)
+            except Exception as e:
+                self._log_tick_error('summary', f"Error updating summary stats: {str(e)}")
+
+        self.after(1000, self._tick)
+
+    def _log_tick_error(self, source: str, message: str):
+        """Log a stats refresh error, repeating an identical one at most every ERROR_LOG_INTERVAL."""
+        now = time.monotonic()
+        last_message, last_time = self._tick_errors.get(source, (None, 0.0))
+        if message != last_message or now - last_time >= self.ERROR_LOG_INTERVAL:
+            logging.error(message)
+            self._tick_errors[source] = (message, now)
 
     def setup_controls(self):
         control_frame = ttk.Frame(self.container)
@@ -646,55 +717,35 @@ class BitcoinEducationApp(tk.Tk):
             command=self.remove_current_tab
         ).pack(side=tk.LEFT, padx=5)
 
-    def get_combined_stats(self):
-        """Combine statistics from all running scanners."""
-        if not self.tabs:
+    def get_combined_stats(self, snapshots: Dict[str, Dict]):
+        """Combine per-scanner statistics snapshots, keyed by tab ID."""
+        if not snapshots:
             return None
 
-        combined_stats = {
-            'active_scanners': len(self.tabs),
-            'total_scanned': 0,
-            'cpu_processed': 0,
-            'gpu_processed': 0,
-            'wallets_with_balance': 0,
-            'cpu_scan_rate': 0.0,
-            'gpu_scan_rate': 0.0,
-            'queue_size': 0
-        }
-
-        for tab in self.tabs.values():
-            stats = tab.scanner.get_statistics()
-            # Convert string numbers with commas to float/int
-            combined_stats['total_scanned'] += int(stats['total_scanned'].replace(',', ''))
-            combined_stats['cpu_processed'] += int(stats['cpu_processed'].replace(',', ''))
-            combined_stats['gpu_processed'] += int(stats['gpu_processed'].replace(',', ''))
-            combined_stats['wallets_with_balance'] += int(stats['wallets_with_balance'].replace(',', ''))
-            combined_stats['cpu_scan_rate'] += float(stats['cpu_scan_rate'].replace(',', ''))
-            combined_stats['gpu_scan_rate'] += float(stats['gpu_scan_rate'].replace(',', ''))
-            combined_stats['queue_size'] += int(stats['queue_size'].replace(',', ''))
-
-        # Format numbers for display
-        for key in ['total_scanned', 'cpu_processed', 'gpu_processed', 'wallets_with_balance', 'queue_size']:
-            combined_stats[key] = f"{combined_stats[key]:,}"
-
-        # Format rates with one decimal place
-        combined_stats['cpu_scan_rate'] = f"{combined_stats['cpu_scan_rate']:.1f}"
-        combined_stats['gpu_scan_rate'] = f"{combined_stats['gpu_scan_rate']:.1f}"
+        # Transpose the snapshots into one column per field and sum each column
+        totals = map(sum, zip(*map(self._SUMMED_FIELDS, snapshots.values())))
+        combined_stats = dict(zip(self.SUMMED_STATS, totals))
+        combined_stats['active_scanners'] = len(self.tabs)
 
+        # Raw sums; SummaryTab formats them for display
         return combined_stats
 
     def add_scanner_tab(self):
-        if len(self.tabs) >= 4:  # Limit to 4 scanners
+        if len(self.tabs) >= self.MAX_SCANNERS:
             messagebox.showwarning(
                 "Limit Reached",
-                "Maximum number of scanners (4) reached."
+                f"Maximum number of scanners ({self.MAX_SCANNERS}) reached."
             )
             return
 
-        tab_id = f"scanner_{len(self.tabs) + 1}"
+        # Numbered from a counter: len(self.tabs) + 1 repeats the ID of a
+        # still-open tab once an earlier one has been removed
+        tab_number = next(self._tab_numbers)
+        tab_id = f"scanner_{tab_number}"
         scanner_tab = WalletScannerTab(self.notebook, tab_id)
-        self.notebook.add(scanner_tab, text=f"Scanner {len(self.tabs) + 1}")
+        self.notebook.add(scanner_tab, text=f"Scanner {tab_number}")
         self.tabs[tab_id] = scanner_tab
+        self._tab_ids[str(scanner_tab)] = tab_id
         self.notebook.select(scanner_tab)
 
     def remove_current_tab(self):
@@ -702,12 +753,7 @@ class BitcoinEducationApp(tk.Tk):
         if not current_tab or str(current_tab) == str(self.summary_tab) or str(current_tab) == str(self.node_settings):
             return
 
-        tab_id = None
-        for id, tab in self.tabs.items():
-            if str(tab) == str(current_tab):
-                tab_id = id
-                break
-
+        tab_id = self._tab_ids.pop(str(current_tab), None)
         if tab_id:
             self.tabs[tab_id].stop_scanning()  # Stop the scanner
             self.notebook.forget(current_tab)  # Remove the tab
@@ -716,6 +762,8 @@ class BitcoinEducationApp(tk.Tk):
     def on_closing(self):
         """Handle application shutdown."""
         try:
+            self.node_status.stop()
+
             # Stop all scanners
             for tab in self.tabs.values():
                 tab.stop_scanning()
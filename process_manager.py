@@ -2,7 +2,8 @@ import multiprocessing
 from multiprocessing import Queue, Value, Array
 import threading
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from queue import Empty
 from wallet_scanner import WalletScanner
@@ -46,7 +47,8 @@ class ProcessPool:
             with self._lock:
                 self.processes[process_id] = {
                     'process': process,
-                    'start_time': datetime.now(),
+                    # Stored formatted; it is only ever displayed
+                    'start_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                     'status': 'running'
                 }
                 self.stats_queues[process_id] = stats_queue
@@ -61,13 +63,38 @@ class ProcessPool:
 
     def stop_process(self, process_id: str) -> bool:
         """Stop a specific process."""
-        if process_id not in self.processes:
-            return False
+        self._stopping.set()
+        try:
+            return self._stop_process(process_id)
+        finally:
+            self._stopping.clear()
 
+    def stop_all(self) -> List[str]:
+        """Stop all processes concurrently, returning the IDs that were stopped."""
+        with self._lock:
+            process_ids = list(self.processes)
+        if not process_ids:
+            return []
+
+        # The stopping flag is set once for the whole batch; each worker
+        # clearing it as its own stop finished would unset it for the rest
+        self._stopping.set()
         try:
-            # Set stopping flag
-            self._stopping.set()
+            # Each stop can spend seconds in join(), so wait on them side by side
+            with ThreadPoolExecutor(max_workers=len(process_ids)) as executor:
+                results = list(executor.map(self._stop_process, process_ids))
+        finally:
+            self._stopping.clear()
+        return [process_id for process_id, stopped in zip(process_ids, results) if stopped]
+
+    def _stop_process(self, process_id: str) -> bool:
+        """Stop one process; the caller owns the stopping flag."""
+        with self._lock:
+            info = self.processes.get(process_id)
+        if info is None:
+            return False
 
+        try:
             # Send stop signal
             try:
                 self.control_queues[process_id].put_nowait('STOP')
@@ -75,7 +102,7 @@ class ProcessPool:
                 pass  # Queue might be full or closed
 
             # Wait for process to terminate
-            process = self.processes[process_id]['process']
+            process = info['process']
             process.join(timeout=2)  # Reduced timeout
 
             if process.is_alive():
@@ -87,12 +114,9 @@ class ProcessPool:
 
             # Clean up
             with self._lock:
-                if process_id in self.processes:
-                    del self.processes[process_id]
-                if process_id in self.stats_queues:
-                    del self.stats_queues[process_id]
-                if process_id in self.control_queues:
-                    del self.control_queues[process_id]
+                self.processes.pop(process_id, None)
+                self.stats_queues.pop(process_id, None)
+                self.control_queues.pop(process_id, None)
 
             logging.info(f"Stopped process {process_id}")
             return True
@@ -100,8 +124,6 @@ class ProcessPool:
         except Exception as e:
             logging.error(f"Failed to stop process {process_id}: {str(e)}")
             return False
-        finally:
-            self._stopping.clear()
 
     def get_process_stats(self, process_id: str) -> Optional[Dict]:
         """Get current statistics for a process."""
@@ -122,7 +144,7 @@ class ProcessPool:
                     if process_id in self.processes:
                         return {
                             'status': self.processes[process_id]['status'],
-                            'start_time': self.processes[process_id]['start_time'].strftime("%Y-%m-%d %H:%M:%S"),
+                            'start_time': self.processes[process_id]['start_time'],
                             'total_scanned': 0,
                             'wallets_found': 0,
                             'scan_rate': 0
@@ -136,20 +158,15 @@ class ProcessPool:
     def _run_scanner(self, process_id: str, stats_queue: Queue, control_queue: Queue):
         """Run the wallet scanner in a separate process."""
         scanner = None
+        # Stats are only ever read latest-first, so don't let exit block on
+        # flushing ones the parent never drained; that stalled every stop
+        # until join() timed out and the process was terminated
+        stats_queue.cancel_join_thread()
         try:
             scanner = WalletScanner()
             scanner.start_scan()
 
             while not self._stopping.is_set():
-                # Check for control commands
-                try:
-                    if not control_queue.empty():
-                        cmd = control_queue.get_nowait()
-                        if cmd == 'STOP':
-                            break
-                except Empty:
-                    pass
-
                 # Update statistics
                 try:
                     stats = scanner.get_statistics()
@@ -158,9 +175,13 @@ class ProcessPool:
                 except Exception as stats_error:
                     logging.error(f"Error updating stats: {stats_error}")
 
-                # Small sleep to prevent CPU overload
-                from time import sleep
-                sleep(0.1)
+                # Waiting on the control queue is the pause between updates,
+                # and a STOP command ends it immediately
+                try:
+                    if control_queue.get(timeout=0.1) == 'STOP':
+                        break
+                except Empty:
+                    pass
 
         except Exception as e:
             logging.error(f"Scanner process {process_id} error: {str(e)}")
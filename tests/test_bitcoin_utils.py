@@ -0,0 +1,137 @@
+import pytest
+
+pytest.importorskip("bitcoinrpc")
+
+import bitcoin_utils
+from bitcoin_utils import BitcoinUtils
+
+
+class FakeProxy:
+    """Stands in for AuthServiceProxy, answering batches with a fixed node state."""
+
+    def __init__(self):
+        self.batches = 0
+        self.blocks = 100
+
+    def batch_(self, calls):
+        self.batches += 1
+        replies = {
+            'getblockchaininfo': {'chain': 'regtest', 'blocks': self.blocks, 'verificationprogress': 1.0},
+            'getconnectioncount': 8,
+        }
+        return [replies[method] for method, *params in calls]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def proxy(monkeypatch):
+    proxy = FakeProxy()
+    monkeypatch.setattr(BitcoinUtils, "get_rpc_connection", classmethod(lambda cls: proxy))
+    monkeypatch.setattr(BitcoinUtils, "_idle_connections", [])
+    monkeypatch.setattr(BitcoinUtils, "_node_info_cache", (0.0, None))
+    return proxy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(bitcoin_utils.time, "monotonic", clock)
+    return clock
+
+
+def test_node_info_is_fetched_in_one_batch(proxy, clock):
+    info = BitcoinUtils.get_node_info()
+    assert info == {'chain': 'regtest', 'blocks': 100, 'peers': 8, 'progress': '100.00%'}
+    assert proxy.batches == 1
+
+
+def test_node_info_cache_hit_within_ttl(proxy, clock):
+    BitcoinUtils.get_node_info()
+    proxy.blocks = 101
+    clock.now += BitcoinUtils.NODE_INFO_TTL / 2
+    assert BitcoinUtils.get_node_info()['blocks'] == 100
+    assert proxy.batches == 1
+
+
+def test_node_info_cache_expires_after_ttl(proxy, clock):
+    BitcoinUtils.get_node_info()
+    proxy.blocks = 101
+    clock.now += BitcoinUtils.NODE_INFO_TTL
+    assert BitcoinUtils.get_node_info()['blocks'] == 101
+    assert proxy.batches == 2
+
+
+def test_node_info_cache_returns_copies(proxy, clock):
+    BitcoinUtils.get_node_info()['blocks'] = 0
+    assert BitcoinUtils.get_node_info()['blocks'] == 100
+    assert BitcoinUtils.latest_node_info()['blocks'] == 100
+
+
+def test_failed_fetch_clears_cache(proxy, clock, monkeypatch):
+    BitcoinUtils.get_node_info()
+    clock.now += BitcoinUtils.NODE_INFO_TTL
+    monkeypatch.setattr(proxy, "batch_", lambda calls: [None, 0])
+    with pytest.raises(ConnectionError):
+        BitcoinUtils.get_node_info()
+    assert BitcoinUtils.latest_node_info() is None
+
+
+class FailingProxy:
+    def __init__(self, error):
+        self.error = error
+
+    def getblockcount(self):
+        raise self.error
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Count the connections _run_pooled opens, each failing with the next queued error."""
+    errors = []
+    opened = []
+
+    def connect(cls):
+        opened.append(FailingProxy(errors.pop(0)))
+        return opened[-1]
+
+    monkeypatch.setattr(BitcoinUtils, "get_rpc_connection", classmethod(connect))
+    monkeypatch.setattr(BitcoinUtils, "_idle_connections", [])
+    return errors, opened
+
+
+def test_reset_connection_is_retried_once(connections):
+    errors, opened = connections
+    errors.extend([ConnectionResetError("reset"), ConnectionRefusedError("refused")])
+    with pytest.raises(ConnectionRefusedError):
+        BitcoinUtils._rpc_call('getblockcount')
+    assert len(opened) == 2
+
+
+def test_timeout_is_not_retried(connections):
+    errors, opened = connections
+    errors.append(TimeoutError("timed out"))
+    with pytest.raises(TimeoutError):
+        BitcoinUtils._rpc_call('getblockcount')
+    assert len(opened) == 1
+    assert BitcoinUtils._idle_connections == []
+
+
+def test_invalid_pool_size_keeps_the_rest_of_the_config(tmp_path, monkeypatch):
+    config_file = tmp_path / "node_settings.txt"
+    config_file.write_text("url=node.example\nport=18443\nusername=alice\npassword=secret\npool_size=zero\n")
+    monkeypatch.setattr(BitcoinUtils, "CONFIG_FILE", str(config_file))
+    for name in ("NODE_URL", "NODE_PORT", "RPC_USER", "RPC_PASS", "RPC_POOL_SIZE", "_pool_slots"):
+        monkeypatch.setattr(BitcoinUtils, name, getattr(BitcoinUtils, name))
+    pool_size = BitcoinUtils.RPC_POOL_SIZE
+
+    assert BitcoinUtils.load_config()
+    assert (BitcoinUtils.NODE_URL, BitcoinUtils.NODE_PORT) == ("node.example", "18443")
+    assert (BitcoinUtils.RPC_USER, BitcoinUtils.RPC_PASS) == ("alice", "secret")
+    assert BitcoinUtils.RPC_POOL_SIZE == pool_size
@@ -0,0 +1,117 @@
+import hashlib
+import os
+
+import pytest
+
+cl = pytest.importorskip("pyopencl")
+
+from gpu_hasher import GPUHasher
+
+# Lengths around the single-block limit, plus multi-block ones
+LENGTHS = [0, 1, 31, 32, 54, 55, 56, 57, 63, 64, 65, 119, 120, 200, 4096]
+
+
+def _messages(lengths):
+    return [os.urandom(length) for length in lengths]
+
+
+def _reference(messages):
+    return [hashlib.sha256(message).digest() for message in messages]
+
+
+@pytest.fixture(scope="module")
+def hasher():
+    try:
+        hasher = GPUHasher()
+    except Exception as e:
+        pytest.skip(f"No OpenCL device available: {e}")
+    if hasher.ctx is None:
+        pytest.skip("No OpenCL device available")
+    return hasher
+
+
+@pytest.fixture
+def device_hasher(hasher, monkeypatch):
+    """The hasher forced onto its OpenCL paths, whatever the device type."""
+    monkeypatch.setattr(hasher, "device_type", "GPU")
+    return hasher
+
+
+def test_cpu_path_matches_hashlib(hasher):
+    messages = _messages(LENGTHS * 3)
+    assert hasher._compute_hash_batch_cpu(messages) == _reference(messages)
+
+
+def test_queues_path_matches_hashlib(hasher):
+    messages = _messages(range(56))
+    assert hasher._compute_hash_batch_queues(messages) == _reference(messages)
+
+
+def test_zero_copy_path_matches_hashlib(hasher):
+    messages = _messages(range(56))
+    assert hasher._compute_hash_batch_zero_copy(messages) == _reference(messages)
+
+
+def test_svm_path_matches_hashlib(hasher):
+    if not hasher.svm_supported:
+        pytest.skip("Device has no SVM support")
+    messages = _messages(range(56))
+    assert hasher._compute_hash_batch_svm(messages) == _reference(messages)
+
+
+def test_prefix_path_matches_hashlib(device_hasher):
+    prefix = os.urandom(128)
+    tails = _messages(range(56))
+    expected = [hashlib.sha256(prefix + tail).digest() for tail in tails]
+    assert device_hasher.compute_hash_batch_with_prefix(prefix, tails) == expected
+
+
+@pytest.mark.parametrize("svm", [False, True])
+def test_batch_accepts_any_length_on_device(device_hasher, monkeypatch, svm):
+    if svm and not device_hasher.svm_supported:
+        pytest.skip("Device has no SVM support")
+    monkeypatch.setattr(device_hasher, "svm_supported", svm)
+    messages = _messages(LENGTHS * 3)
+    assert device_hasher.compute_hash_batch(messages) == _reference(messages)
+
+
+def test_stream_accepts_any_length_on_device(device_hasher):
+    messages = _messages(list(range(56)) * 4 + [56, 200] + list(range(56)))
+    assert list(device_hasher.compute_hash_stream(messages, chunk=16)) == _reference(messages)
+
+
+def test_device_kernel_takes_55_byte_messages(hasher):
+    messages = _messages([GPUHasher.BLOCK_MESSAGE_MAX] * 5)
+    assert hasher._compute_hash_batch_queues(messages) == _reference(messages)
+
+
+def test_device_staging_rejects_56_byte_messages():
+    with pytest.raises(ValueError):
+        GPUHasher._prepare_input(_messages([GPUHasher.BLOCK_MESSAGE_MAX + 1]))
+
+
+def test_prefix_tails_limited_to_one_block(hasher):
+    with pytest.raises(ValueError):
+        hasher.compute_hash_batch_with_prefix(os.urandom(64), _messages([GPUHasher.BLOCK_MESSAGE_MAX + 1]))
+
+
+@pytest.mark.parametrize("local_size", [48, 192, 240])
+def test_non_power_of_two_local_size(device_hasher, monkeypatch, local_size):
+    monkeypatch.setattr(device_hasher, "_local_sizes", dict.fromkeys(device_hasher._local_sizes, local_size))
+    for batch_size in (1, 10, 1000):
+        global_size, local = device_hasher._work_sizes(batch_size)
+        assert local == local_size
+        assert global_size % local_size == 0
+        assert global_size >= min(batch_size, device_hasher.gpu_threads)
+
+    monkeypatch.setattr(device_hasher, "svm_supported", False)
+    monkeypatch.setattr(device_hasher, "host_unified_memory", False)
+    messages = _messages(range(56))
+    assert device_hasher.compute_hash_batch(messages) == _reference(messages)
+
+
+@pytest.mark.parametrize("length", [0, 3, 32, 33, 55])
+@pytest.mark.parametrize("count", [1, 33, 1000])
+def test_uniform_batches_match_hashlib(hasher, length, count):
+    messages = _messages([length] * count)
+    assert hasher._compute_hash_batch_queues(messages) == _reference(messages)
@@ -63,18 +63,21 @@ class WalletScanner:
         self.cpu_scan_rates = deque(maxlen=10)
         self.gpu_scan_rates = deque(maxlen=10)
         self.scan_rates = deque(maxlen=10)  # Combined rates
+        # Per-minute averages, refreshed whenever a rate is sampled
+        self._cpu_rate_per_min = 0.0
+        self._gpu_rate_per_min = 0.0
         self.last_cpu_time = time.time()
         self.last_gpu_time = time.time()
 
         # Add cached stats to prevent blocking
         self._cached_stats = {
-            'total_scanned': "0",
-            'cpu_processed': "0",
-            'gpu_processed': "0",
-            'wallets_with_balance': "0",
-            'cpu_scan_rate': "0.0",
-            'gpu_scan_rate': "0.0",
-            'queue_size': "0",
+            'total_scanned': 0,
+            'cpu_processed': 0,
+            'gpu_processed': 0,
+            'wallets_with_balance': 0,
+            'cpu_scan_rate': 0.0,
+            'gpu_scan_rate': 0.0,
+            'queue_size': 0,
             'node_chain': 'unknown',
             'node_height': 0
         }
@@ -183,26 +186,19 @@ class WalletScanner:
                         'blocks': 0
                     }
                 else:
-                    try:
-                        node_info = BitcoinUtils.get_node_info()
-                    except Exception as e:
-                        logging.warning(f"Failed to get node info: {str(e)}")
-                        node_info = {'chain': 'unknown', 'blocks': 0}
-
-                cpu_rate = self.cpu_scan_rate
-                cpu_rate_per_min = cpu_rate * 60 if cpu_rate > 0 else 0
-
-                gpu_rate = self.gpu_scan_rate
-                gpu_rate_per_min = gpu_rate * 60 if gpu_rate > 0 else 0
+                    # The app's node status poller keeps this fresh; reading it
+                    # here costs no RPC however many scanners are refreshing
+                    node_info = BitcoinUtils.latest_node_info() or {'chain': 'unknown', 'blocks': 0}
 
+                # Raw numbers; display code formats them
                 self._cached_stats = {
-                    'total_scanned': f"{self.shared_total.value:,}",
-                    'cpu_processed': f"{self.cpu_processed.value:,}",
-                    'gpu_processed': f"{self.gpu_processed.value:,}",
-                    'wallets_with_balance': f"{self.shared_balance_count.value:,}",
-                    'cpu_scan_rate': f"{cpu_rate_per_min:,.1f}",
-                    'gpu_scan_rate': f"{gpu_rate_per_min:,.1f}",
-                    'queue_size': f"{self.wallet_queue.qsize():,}",
+                    'total_scanned': self.shared_total.value,
+                    'cpu_processed': self.cpu_processed.value,
+                    'gpu_processed': self.gpu_processed.value,
+                    'wallets_with_balance': self.shared_balance_count.value,
+                    'cpu_scan_rate': round(self.cpu_rate_per_min, 1),
+                    'gpu_scan_rate': round(self.gpu_rate_per_min, 1),
+                    'queue_size': self.wallet_queue.qsize(),
                     'node_chain': node_info['chain'],
                     'node_height': node_info['blocks']
                 }
@@ -401,7 +397,7 @@ class WalletScanner:
                         if time_diff >= 1.0:  # Update rate every second
                             rate = local_processed / time_diff
                             with self._lock:
-                                self.cpu_scan_rates.append(rate)
+                                self._cpu_rate_per_min = self._record_rate(self.cpu_scan_rates, rate)
                                 self.scan_rates.append(rate)  # Update combined rates
                             local_processed = 0
                             local_start_time = current_time
@@ -435,7 +431,8 @@ class WalletScanner:
                         current_time = time.time()
                         if self.last_gpu_time:
                             rate = len(batch) / (current_time - self.last_gpu_time)
-                            self.gpu_scan_rates.append(rate)
+                            with self._lock:
+                                self._gpu_rate_per_min = self._record_rate(self.gpu_scan_rates, rate)
                         self.last_gpu_time = current_time
                     with self.shared_total.get_lock():
                         self.shared_total.value += len(batch)
@@ -482,21 +479,31 @@ class WalletScanner:
                 self._process_pool = None
         logging.debug(f"Instance {self.instance_id}: Executor cleanup complete")
 
+    @staticmethod
+    def _record_rate(rates: deque, rate: float) -> float:
+        """Add a per-second rate sample and return the new per-minute average; call with _lock held."""
+        rates.append(rate)
+        return sum(rates) / len(rates) * 60
+
     @property
     def cpu_scan_rate(self):
-        """Calculate current CPU scan rate."""
-        with self._lock:
-            if not self.cpu_scan_rates:
-                return 0
-            return sum(self.cpu_scan_rates) / len(self.cpu_scan_rates)
+        """Current CPU scan rate, per second."""
+        return self._cpu_rate_per_min / 60
 
     @property
     def gpu_scan_rate(self):
-        """Calculate current GPU scan rate."""
-        with self._lock:
-            if not self.gpu_scan_rates:
-                return 0
-            return sum(self.gpu_scan_rates) / len(self.gpu_scan_rates)
+        """Current GPU scan rate, per second."""
+        return self._gpu_rate_per_min / 60
+
+    @property
+    def cpu_rate_per_min(self):
+        """Current CPU scan rate, per minute."""
+        return self._cpu_rate_per_min
+
+    @property
+    def gpu_rate_per_min(self):
+        """Current GPU scan rate, per minute."""
+        return self._gpu_rate_per_min
 
     def set_thread_count(self, count: int):
         if count < 1:
@@ -536,9 +543,12 @@ class WalletScanner:
     def _reset_statistics(self):
         """Reset all statistics counters."""
         with self._stats_lock:
-            self.cpu_scan_rates.clear()
-            self.gpu_scan_rates.clear()
-            self.scan_rates.clear()
+            with self._lock:
+                self.cpu_scan_rates.clear()
+                self.gpu_scan_rates.clear()
+                self.scan_rates.clear()
+                self._cpu_rate_per_min = 0.0
+                self._gpu_rate_per_min = 0.0
 
             with self.shared_total.get_lock():
                 self.shared_total.value = 0
@@ -550,13 +560,13 @@ class WalletScanner:
                 self.gpu_processed.value = 0
 
             self._cached_stats = {
-                'total_scanned': "0",
-                'cpu_processed': "0",
-                'gpu_processed': "0",
-                'wallets_with_balance': "0",
-                'cpu_scan_rate': "0.0",
-                'gpu_scan_rate': "0.0",
-                'queue_size': "0",
+                'total_scanned': 0,
+                'cpu_processed': 0,
+                'gpu_processed': 0,
+                'wallets_with_balance': 0,
+                'cpu_scan_rate': 0.0,
+                'gpu_scan_rate': 0.0,
+                'queue_size': 0,
                 'node_chain': 'unknown',
                 'node_height': 0
             }
\ No newline at end of file